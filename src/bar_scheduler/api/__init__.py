@@ -1,83 +1,165 @@
-"""bar-scheduler public API."""
+"""
+bar-scheduler public API.
+
+Names are resolved lazily (PEP 562): ``from bar_scheduler.api import
+get_profile`` imports only the submodule that defines it, so callers that
+never plan or analyse do not pay for importing the planner.
+"""
 from __future__ import annotations
 
-# Exceptions
-from ._common import (
-    ProfileNotFoundError,
-    HistoryNotFoundError,
-    SessionNotFoundError,
-    ProfileAlreadyExistsError,
-)
-
-# ValidationError from io layer
-from ..io.serializers import ValidationError
-
-# Types
-from .types import SessionType, SessionInput, SetInput
-
-# Profile
-from ._profile import (
-    init_profile,
-    get_profile,
-    update_bodyweight,
-    update_height,
-    update_language,
-    update_profile,
-)
-
-# Exercises
-from ._exercises import (
-    list_exercises,
-    get_exercise_info,
-    get_equipment_catalog,
-    set_exercise_target,
-    set_exercise_days,
-    enable_exercise,
-    disable_exercise,
-    delete_exercise_history,
-)
-
-# Sessions
-from ._sessions import (
-    log_session,
-    delete_session,
-    get_history,
-)
-
-# Planning
-from ._plan import (
-    get_plan,
-    set_plan_start_date,
-    get_plan_weeks,
-    set_plan_weeks,
-)
-
-# Analysis
-from ._analysis import (
-    get_training_status,
-    get_onerepmax_data,
-    get_volume_data,
-    get_progress_data,
-    get_overtraining_status,
-    get_goal_metrics,
-    training_max_from_baseline,
-)
-
-# Equipment
-from ._equipment import (
-    update_equipment,
-    get_current_equipment,
-    compute_leff,
-    compute_equipment_adjustment,
-    get_assistance_kg,
-)
-
-# Utils
-from ._utils import (
-    get_data_dir,
-    parse_sets_string,
-    parse_compact_sets,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Exceptions
+    from ._common import (
+        ProfileNotFoundError,
+        HistoryNotFoundError,
+        SessionNotFoundError,
+        ProfileAlreadyExistsError,
+    )
+
+    # ValidationError from io layer
+    from ..io.serializers import ValidationError
+
+    # Types
+    from .types import SessionType, SessionInput, SetInput
+
+    # Profile
+    from ._profile import (
+        init_profile,
+        get_profile,
+        update_bodyweight,
+        update_height,
+        update_language,
+        update_profile,
+    )
+
+    # Exercises
+    from ._exercises import (
+        list_exercises,
+        get_exercise_info,
+        get_equipment_catalog,
+        set_exercise_target,
+        set_exercise_days,
+        enable_exercise,
+        disable_exercise,
+        delete_exercise_history,
+    )
+
+    # Sessions
+    from ._sessions import (
+        log_session,
+        delete_session,
+        get_history,
+    )
+
+    # Planning
+    from ._plan import (
+        get_plan,
+        set_plan_start_date,
+        get_plan_weeks,
+        set_plan_weeks,
+    )
+
+    # Analysis
+    from ._analysis import (
+        get_training_status,
+        get_onerepmax_data,
+        get_volume_data,
+        get_progress_data,
+        get_overtraining_status,
+        get_goal_metrics,
+        training_max_from_baseline,
+    )
+
+    # Equipment
+    from ._equipment import (
+        update_equipment,
+        get_current_equipment,
+        compute_leff,
+        compute_equipment_adjustment,
+        get_assistance_kg,
+    )
+
+    # Utils
+    from ._utils import (
+        get_data_dir,
+        parse_sets_string,
+        parse_compact_sets,
+    )
+
+# Public name -> module (relative to this package) that defines it.
+_EXPORTS: dict[str, str] = {
+    # Exceptions
+    "ProfileNotFoundError": "._common",
+    "HistoryNotFoundError": "._common",
+    "SessionNotFoundError": "._common",
+    "ProfileAlreadyExistsError": "._common",
+    "ValidationError": "..io.serializers",
+    # Types
+    "SessionType": ".types",
+    "SessionInput": ".types",
+    "SetInput": ".types",
+    # Profile
+    "init_profile": "._profile",
+    "get_profile": "._profile",
+    "update_bodyweight": "._profile",
+    "update_height": "._profile",
+    "update_language": "._profile",
+    "update_profile": "._profile",
+    # Exercises
+    "list_exercises": "._exercises",
+    "get_exercise_info": "._exercises",
+    "get_equipment_catalog": "._exercises",
+    "set_exercise_target": "._exercises",
+    "set_exercise_days": "._exercises",
+    "enable_exercise": "._exercises",
+    "disable_exercise": "._exercises",
+    "delete_exercise_history": "._exercises",
+    # Sessions
+    "log_session": "._sessions",
+    "delete_session": "._sessions",
+    "get_history": "._sessions",
+    # Planning
+    "get_plan": "._plan",
+    "set_plan_start_date": "._plan",
+    "get_plan_weeks": "._plan",
+    "set_plan_weeks": "._plan",
+    # Analysis
+    "get_training_status": "._analysis",
+    "get_onerepmax_data": "._analysis",
+    "get_volume_data": "._analysis",
+    "get_progress_data": "._analysis",
+    "get_overtraining_status": "._analysis",
+    "get_goal_metrics": "._analysis",
+    "training_max_from_baseline": "._analysis",
+    # Equipment
+    "update_equipment": "._equipment",
+    "get_current_equipment": "._equipment",
+    "compute_leff": "._equipment",
+    "compute_equipment_adjustment": "._equipment",
+    "get_assistance_kg": "._equipment",
+    # Utils
+    "get_data_dir": "._utils",
+    "parse_sets_string": "._utils",
+    "parse_compact_sets": "._utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # Exceptions
@@ -1,7 +1,9 @@
 """Analysis functions for the bar-scheduler API."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
 
 from ..core.adaptation import get_training_status as _get_training_status
@@ -15,9 +17,10 @@ from ..core.metrics import (
     estimate_1rm,
     get_test_sessions,
     session_max_reps as _session_max_reps,
+    session_total_reps,
     training_max_from_baseline,
 )
-from ._common import _require_store
+from ._common import _load_user_state, _require_store
 
 
 def get_training_status(data_dir: Path, exercise_id: str) -> dict:
@@ -27,8 +30,7 @@ def get_training_status(data_dir: Path, exercise_id: str) -> dict:
     Includes training_max, latest_test_max, trend, plateau flag, deload
     recommendation, and fitness-fatigue state.
     """
-    store = _require_store(data_dir, exercise_id)
-    user_state = store.load_user_state(exercise_id)
+    _, user_state = _load_user_state(data_dir, exercise_id)
     status = _get_training_status(
         user_state.history, user_state.profile.bodyweight_kg
     )
@@ -55,8 +57,7 @@ def get_onerepmax_data(data_dir: Path, exercise_id: str) -> dict | None:
     ``effective_load_kg``, and ``best_date``.
     """
     exercise = get_exercise(exercise_id)
-    store = _require_store(data_dir, exercise_id)
-    user_state = store.load_user_state(exercise_id)
+    _, user_state = _load_user_state(data_dir, exercise_id)
     return estimate_1rm(
         exercise, user_state.profile.bodyweight_kg, user_state.history
     )
@@ -77,36 +78,34 @@ def get_volume_data(
     store = _require_store(data_dir, exercise_id)
     sessions = store.load_history(exercise_id)
 
-    weekly: dict[int, dict] = {}
+    # Indexed by weeks ago; the window is fixed, so plain lists replace a dict.
+    totals = [0] * weeks
+    week_starts: list[str | None] = [None] * weeks
     if sessions:
-        latest = datetime.strptime(sessions[-1].date, "%Y-%m-%d")
-        for s in sessions:
-            s_dt = datetime.strptime(s.date, "%Y-%m-%d")
-            ago = (latest - s_dt).days // 7
-            if ago < weeks:
-                reps = sum(
-                    sr.actual_reps
-                    for sr in s.completed_sets
-                    if sr.actual_reps is not None
-                )
-                if ago not in weekly:
-                    # Compute week start (Monday)
-                    monday = s_dt - timedelta(days=s_dt.weekday())
-                    weekly[ago] = {
-                        "total_reps": 0,
-                        "week_start": monday.strftime("%Y-%m-%d"),
-                    }
-                weekly[ago]["total_reps"] += reps
+        latest = date.fromisoformat(sessions[-1].date)
+        latest_ord = latest.toordinal()
+        # History is sorted by ISO date: skip straight past everything at
+        # least ``weeks`` whole weeks older than the latest session, which
+        # leaves only sessions with 0 <= ago < weeks.
+        cutoff = (latest - timedelta(days=7 * max(weeks, 0))).isoformat()
+        start = bisect_right(sessions, cutoff, key=attrgetter("date"))
+        for s in sessions[start:]:
+            s_date = date.fromisoformat(s.date)
+            s_ord = s_date.toordinal()
+            ago = (latest_ord - s_ord) // 7
+            if week_starts[ago] is None:
+                # Compute week start (Monday)
+                week_starts[ago] = date.fromordinal(s_ord - s_date.weekday()).isoformat()
+            totals[ago] += session_total_reps(s)
 
     result = []
     for i in range(weeks - 1, -1, -1):
         label = "This week" if i == 0 else ("Last week" if i == 1 else f"{i} weeks ago")
-        entry = weekly.get(i, {})
         result.append(
             {
                 "label": label,
-                "week_start": entry.get("week_start"),
-                "total_reps": entry.get("total_reps", 0),
+                "week_start": week_starts[i],
+                "total_reps": totals[i],
             }
         )
 
@@ -133,16 +132,16 @@ def get_progress_data(
     from ..core.config import TARGET_MAX_REPS
 
     exercise_def = get_exercise(exercise_id)
-    store = _require_store(data_dir, exercise_id)
-    user_state = store.load_user_state(exercise_id)
+    _, user_state = _load_user_state(data_dir, exercise_id)
 
     sessions = user_state.history
     test_sessions = get_test_sessions(sessions)
 
+    # One walk over each session's sets: compute max reps once, then filter.
     data_points = [
-        {"date": s.date, "max_reps": _session_max_reps(s)}
+        {"date": s.date, "max_reps": max_reps}
         for s in test_sessions
-        if _session_max_reps(s) > 0
+        if (max_reps := _session_max_reps(s)) > 0
     ]
 
     traj_types = set(trajectory_types.lower())
@@ -157,7 +156,7 @@ def get_progress_data(
         target_weight_kg = 0.0
 
         try:
-            profile = store.load_profile()
+            profile = user_state.profile
             ex_target = (
                 profile.target_for_exercise(exercise_id) if profile else None
             )
@@ -173,25 +172,27 @@ def get_progress_data(
             pass
 
         # Build base trajectory points
-        base_pts: list[tuple[datetime, float]] = []
+        # Dates are formatted once here; the z/g/m projections below all
+        # reuse the same strings.
+        base_pts: list[tuple[str, float]] = []
         latest_test = test_sessions[-1]
-        start_dt = datetime.strptime(latest_test.date, "%Y-%m-%d")
+        start_dt = datetime.fromisoformat(latest_test.date)
         initial_tm = training_max_from_baseline(_session_max_reps(latest_test))
         tm_target = int(traj_target * TM_FACTOR)
         d, tm_f = start_dt, float(initial_tm)
         while tm_f < tm_target and d <= start_dt + timedelta(weeks=104):
-            base_pts.append((d, tm_f / TM_FACTOR))
+            base_pts.append((d.date().isoformat(), tm_f / TM_FACTOR))
             tm_f = min(
                 tm_f + expected_reps_per_week(int(tm_f), tm_target),
                 float(tm_target),
             )
             d += timedelta(weeks=1)
-        base_pts.append((d, float(traj_target)))
+        base_pts.append((d.date().isoformat(), float(traj_target)))
 
         if "z" in traj_types and base_pts:
             traj_z = [
                 {
-                    "date": pt.strftime("%Y-%m-%d"),
+                    "date": pt,
                     "projected_bw_reps": round(val, 2),
                 }
                 for pt, val in base_pts
@@ -207,7 +208,7 @@ def get_progress_data(
                 pts_g = list(base_pts)
             traj_g = [
                 {
-                    "date": pt.strftime("%Y-%m-%d"),
+                    "date": pt,
                     "projected_goal_reps": round(val, 2),
                 }
                 for pt, val in pts_g
@@ -221,7 +222,7 @@ def get_progress_data(
                 if added is not None:
                     m_pts.append(
                         {
-                            "date": pt.strftime("%Y-%m-%d"),
+                            "date": pt,
                             "projected_1rm_added_kg": round(added, 2),
                         }
                     )
@@ -249,8 +250,7 @@ def get_goal_metrics(data_dir: Path, exercise_id: str) -> dict:
     - ``volume_set`` -- ``goal_leff × goal_reps``, a single set at goal spec (``float | None``)
     """
     exercise = get_exercise(exercise_id)
-    store = _require_store(data_dir, exercise_id)
-    user_state = store.load_user_state(exercise_id)
+    _, user_state = _load_user_state(data_dir, exercise_id)
 
     target = user_state.profile.target_for_exercise(exercise_id)
     if target is None:
@@ -285,8 +285,7 @@ def get_overtraining_status(data_dir: Path, exercise_id: str) -> dict:
     Returns a dict with ``level`` (0–3), ``description``, and
     ``extra_rest_days``. Level 0 = no issue; level 3 = severe.
     """
-    store = _require_store(data_dir, exercise_id)
-    user_state = store.load_user_state(exercise_id)
+    _, user_state = _load_user_state(data_dir, exercise_id)
     return overtraining_severity(
         user_state.history, user_state.profile.days_for_exercise(exercise_id)
     )
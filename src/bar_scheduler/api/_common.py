@@ -1,16 +1,22 @@
 """Shared exceptions and private helpers for the bar-scheduler API."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
+from ..core.config import MAX_PLAN_WEEKS
 from ..core.equipment import compute_leff
 from ..core.exercises.base import ExerciseDefinition
 from ..core.metrics import best_1rm_from_leff
-from ..core.models import SessionResult
+from ..core.models import SessionResult, UserState
 from ..core.timeline import TimelineEntry
 from ..io.user_store import UserStore
 
+# Upper bound on the plan horizon get_plan will generate.
+_MAX_TOTAL_WEEKS = MAX_PLAN_WEEKS * 3
+
 
 # ---------------------------------------------------------------------------
 # Typed exceptions
@@ -38,16 +44,45 @@ class ProfileAlreadyExistsError(FileExistsError):
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=32)
+def _get_store(data_dir: Path) -> UserStore:
+    """Return the UserStore for ``data_dir``, shared across API calls.
+
+    A store only holds resolved paths, so reusing it is safe and saves
+    rebuilding the profile/history Path objects on every call.
+    """
+    return UserStore(data_dir)
+
+
 def _require_profile_store(data_dir: Path) -> UserStore:
     """Return a UserStore, raising ProfileNotFoundError if profile.json is missing."""
-    store = UserStore(data_dir)
+    store = _get_store(data_dir)
     if not store.profile_path.exists():
-        raise ProfileNotFoundError(
-            f"Profile not found at {store.profile_path}. Call init_profile() first."
-        )
+        raise _profile_not_found(store)
     return store
 
 
+def _load_profile_data(data_dir: Path) -> tuple[UserStore, dict]:
+    """
+    Return the store and the raw profile.json document for in-place edits.
+
+    Raises ProfileNotFoundError if the profile is missing.  Write the edited
+    document back with ``store._write_profile_data`` (atomic replace).
+    """
+    store = _get_store(data_dir)
+    data = store._read_profile_data()
+    if data is None:
+        raise _profile_not_found(store)
+    return store, data
+
+
+def _profile_not_found(store: UserStore) -> ProfileNotFoundError:
+    """Build the ProfileNotFoundError raised for a missing profile.json."""
+    return ProfileNotFoundError(
+        f"Profile not found at {store.profile_path}. Call init_profile() first."
+    )
+
+
 def _require_store(data_dir: Path, exercise_id: str) -> UserStore:
     """Return a UserStore, raising typed errors when profile or history files are missing."""
     store = _require_profile_store(data_dir)
@@ -58,40 +93,62 @@ def _require_store(data_dir: Path, exercise_id: str) -> UserStore:
     return store
 
 
+def _load_user_state(data_dir: Path, exercise_id: str) -> tuple[UserStore, UserState]:
+    """
+    Return the store and loaded user state, with _require_store's typed errors.
+
+    The load is attempted first; the existence checks that pick the typed
+    error only run when it fails, so the common path stats each file once.
+    """
+    store = _get_store(data_dir)
+    try:
+        return store, store.load_user_state(exercise_id)
+    except FileNotFoundError:
+        _require_store(data_dir, exercise_id)
+        raise
+
+
 def _resolve_plan_start(
-    store: UserStore, exercise_id: str, history: list[SessionResult]
+    store: UserStore,
+    exercise_id: str,
+    history: list[SessionResult],
+    now: datetime | None = None,
 ) -> str:
     plan_start = store.get_plan_start_date(exercise_id)
     if plan_start is None:
         if history:
-            first_dt = datetime.strptime(history[0].date, "%Y-%m-%d")
-            plan_start = (first_dt + timedelta(days=1)).strftime("%Y-%m-%d")
+            first_dt = datetime.fromisoformat(history[0].date)
+            plan_start = (first_dt + timedelta(days=1)).date().isoformat()
         else:
-            plan_start = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+            now = now or datetime.now()
+            plan_start = (now + timedelta(days=1)).date().isoformat()
     return plan_start
 
 
-def _total_weeks(plan_start_date: str, weeks_ahead: int = 4) -> int:
-    from ..core.config import MAX_PLAN_WEEKS
-
+def _total_weeks(
+    plan_start_date: str, weeks_ahead: int = 4, now: datetime | None = None
+) -> int:
     plan_start_dt = datetime.strptime(plan_start_date, "%Y-%m-%d")
-    weeks_since_start = max(0, (datetime.now() - plan_start_dt).days // 7)
-    return max(2, min(weeks_since_start + weeks_ahead, MAX_PLAN_WEEKS * 3))
+    now = now or datetime.now()
+    weeks_since_start = max(0, (now - plan_start_dt).days // 7)
+    return max(2, min(weeks_since_start + weeks_ahead, _MAX_TOTAL_WEEKS))
 
 
 def _session_performance_metrics(
-    sets_leff_reps: list[tuple[float, int]],
+    sets_leff_reps: Iterable[tuple[float, int]],
 ) -> dict:
     """Compute volume_session, avg_volume_set, estimated_1rm from (leff, reps) pairs."""
-    volumes = [leff * reps for leff, reps in sets_leff_reps]
-    n = len(volumes)
-    volume_session = sum(volumes)
-    avg_volume_set = volume_session / n if n > 0 else 0.0
+    # One pass: accumulate volume, set count and best 1RM together.
+    n = 0
+    volume_session = 0.0
     best_1rm: float | None = None
     for leff, reps in sets_leff_reps:
+        n += 1
+        volume_session += leff * reps
         est = best_1rm_from_leff(leff, reps)
         if est is not None and (best_1rm is None or est > best_1rm):
             best_1rm = est
+    avg_volume_set = volume_session / n if n > 0 else 0.0
     return {
         "volume_session": round(volume_session, 2),
         "avg_volume_set": round(avg_volume_set, 2),
@@ -105,55 +162,52 @@ def _timeline_entry_to_dict(
     current_bw: float | None = None,
 ) -> dict:
     """Serialise a TimelineEntry to a JSON-friendly dict."""
+    # Resolve the entry's source once; each set list is then walked a single time.
+    actual, planned = e.actual, e.planned
+    if actual is not None:
+        prescribed = actual.planned_sets or (planned.sets if planned is not None else None)
+        plan_type, plan_grip = actual.session_type, actual.grip
+    elif planned is not None:
+        prescribed = planned.sets
+        plan_type, plan_grip = planned.session_type, planned.grip
+    else:
+        prescribed = None
+        plan_type = plan_grip = ""
+
     planned_sets = None
-    if e.actual is not None and e.actual.planned_sets:
+    if prescribed:
         planned_sets = [
             {
                 "reps": s.target_reps,
                 "weight_kg": s.added_weight_kg,
                 "rest_s": s.rest_seconds_before,
             }
-            for s in e.actual.planned_sets
-        ]
-    elif e.planned is not None and e.planned.sets:
-        planned_sets = [
-            {
-                "reps": s.target_reps,
-                "weight_kg": s.added_weight_kg,
-                "rest_s": s.rest_seconds_before,
-            }
-            for s in e.planned.sets
+            for s in prescribed
         ]
 
     actual_sets = None
-    if e.actual is not None:
+    if actual is not None:
         actual_sets = [
             {
                 "reps": s.actual_reps,
                 "weight_kg": s.added_weight_kg,
                 "rest_s": s.rest_seconds_before,
             }
-            for s in e.actual.completed_sets
+            for s in actual.completed_sets
             if s.actual_reps is not None
         ]
 
-    plan_type = (
-        e.actual.session_type
-        if e.actual
-        else (e.planned.session_type if e.planned else "")
-    )
-    plan_grip = e.actual.grip if e.actual else (e.planned.grip if e.planned else "")
-
     # Performance metrics for this session.
     # For completed sessions: use cached session_metrics (None if old record).
     # For planned/future sessions: compute from prescribed sets if exercise/BW available.
     session_metrics: dict | None = None
-    if e.actual is not None:
-        session_metrics = e.actual.session_metrics
-    elif e.planned is not None and exercise is not None and current_bw is not None:
+    if actual is not None:
+        if actual.session_metrics is not None:
+            session_metrics = dict(actual.session_metrics)
+    elif planned is not None and exercise is not None and current_bw is not None:
         leff_reps = [
             (compute_leff(exercise.bw_fraction, current_bw, s.added_weight_kg, 0.0), s.target_reps)
-            for s in e.planned.sets
+            for s in planned.sets
             if s.target_reps > 0
         ]
         if leff_reps:
@@ -166,12 +220,12 @@ def _timeline_entry_to_dict(
         "grip": plan_grip,
         "status": e.status,
         "id": e.actual_id,
-        "expected_tm": e.planned.expected_tm if e.planned else None,
+        "expected_tm": planned.expected_tm if planned else None,
         "prescribed_sets": planned_sets,
         "actual_sets": actual_sets,
         "track_b": e.track_b,
         "session_metrics": session_metrics,
         "prescribed_assistance_kg": (
-            e.planned.prescribed_assistance_kg if e.planned is not None else None
+            planned.prescribed_assistance_kg if planned is not None else None
         ),
     }
@@ -3,8 +3,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from ..core.adaptation import get_training_status as _get_training_status
 from ..core.exercises.registry import get_exercise
+from ..core.metrics import training_max
 from ._common import _require_store
 
 
@@ -97,9 +97,7 @@ def get_current_equipment(data_dir: Path, exercise_id: str) -> dict | None:
         return None
     ex = get_exercise(exercise_id)
     user_state = store.load_user_state(exercise_id)
-    current_tm = _get_training_status(
-        user_state.history, user_state.profile.bodyweight_kg
-    ).training_max
+    current_tm = training_max(user_state.history)
     recommended = recommend_equipment_item(state.available_items, ex, current_tm)
     # Compute recommended assistance using H-session target reps as reference
     history = [s for s in user_state.history if s.exercise_id == exercise_id]
@@ -1,13 +1,12 @@
 """Exercise management functions for the bar-scheduler API."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from ..core.exercises.registry import get_exercise
-from ..io.user_store import UserStore
+from ..core.models import VALID_DAYS_PER_WEEK
 from ..io.serializers import exercise_target_to_dict
-from ._common import _require_profile_store
+from ._common import _load_profile_data, _require_profile_store
 
 
 def list_exercises() -> dict[str, dict]:
@@ -109,16 +108,13 @@ def set_exercise_target(
         reps=reps, weight_kg=weight_kg
     )  # validates reps > 0, weight >= 0
 
-    store = _require_profile_store(data_dir)
-    with open(store.profile_path) as f:
-        data = json.load(f)
+    store, data = _load_profile_data(data_dir)
 
     if "exercise_targets" not in data:
         data["exercise_targets"] = {}
     data["exercise_targets"][exercise_id] = exercise_target_to_dict(target)
 
-    with open(store.profile_path, "w") as f:
-        json.dump(data, f, indent=2)
+    store._write_profile_data(data)
 
 
 def set_exercise_days(
@@ -133,19 +129,16 @@ def set_exercise_days(
     Raises ``ValueError`` for unknown ``exercise_id`` or out-of-range days.
     """
     get_exercise(exercise_id)
-    if days_per_week not in (1, 2, 3, 4, 5):
+    if days_per_week not in VALID_DAYS_PER_WEEK:
         raise ValueError(f"days_per_week must be 1–5, got {days_per_week}")
 
-    store = _require_profile_store(data_dir)
-    with open(store.profile_path) as f:
-        data = json.load(f)
+    store, data = _load_profile_data(data_dir)
 
     if "exercise_days" not in data:
         data["exercise_days"] = {}
     data["exercise_days"][exercise_id] = days_per_week
 
-    with open(store.profile_path, "w") as f:
-        json.dump(data, f, indent=2)
+    store._write_profile_data(data)
 
 
 def enable_exercise(data_dir: Path, exercise_id: str, *, days_per_week: int) -> None:
@@ -157,13 +150,10 @@ def enable_exercise(data_dir: Path, exercise_id: str, *, days_per_week: int) ->
     Raises ``ProfileNotFoundError`` if the profile has not been initialised.
     """
     get_exercise(exercise_id)
-    if days_per_week not in (1, 2, 3, 4, 5):
+    if days_per_week not in VALID_DAYS_PER_WEEK:
         raise ValueError(f"days_per_week must be 1–5, got {days_per_week}")
 
-    store = _require_profile_store(data_dir)
-
-    with open(store.profile_path) as f:
-        data = json.load(f)
+    store, data = _load_profile_data(data_dir)
 
     enabled = list(data.get("exercises_enabled", []))
     if exercise_id not in enabled:
@@ -174,12 +164,9 @@ def enable_exercise(data_dir: Path, exercise_id: str, *, days_per_week: int) ->
         data["exercise_days"] = {}
     data["exercise_days"][exercise_id] = days_per_week
 
-    with open(store.profile_path, "w") as f:
-        json.dump(data, f, indent=2)
+    store._write_profile_data(data)
 
-    UserStore(data_dir).init_exercise(
-        exercise_id
-    )  # create JSONL if missing (idempotent)
+    store.init_exercise(exercise_id)  # create JSONL if missing (idempotent)
 
 
 def disable_exercise(data_dir: Path, exercise_id: str) -> None:
@@ -190,17 +177,13 @@ def disable_exercise(data_dir: Path, exercise_id: str) -> None:
     The history file is preserved (data is never deleted automatically).
     Raises ``ProfileNotFoundError`` if the profile has not been initialised.
     """
-    store = _require_profile_store(data_dir)
-
-    with open(store.profile_path) as f:
-        data = json.load(f)
+    store, data = _load_profile_data(data_dir)
 
     enabled = list(data.get("exercises_enabled", []))
     if exercise_id in enabled:
         enabled.remove(exercise_id)
         data["exercises_enabled"] = enabled
-        with open(store.profile_path, "w") as f:
-            json.dump(data, f, indent=2)
+        store._write_profile_data(data)
 
 
 def delete_exercise_history(data_dir: Path, exercise_id: str) -> None:
@@ -214,4 +197,4 @@ def delete_exercise_history(data_dir: Path, exercise_id: str) -> None:
     Raises ``ProfileNotFoundError`` if the profile has not been initialised.
     """
     store = _require_profile_store(data_dir)
-    store.history_path(exercise_id).unlink(missing_ok=True)
+    store.delete_history(exercise_id)
@@ -1,6 +1,7 @@
 """Planning functions for the bar-scheduler API."""
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
 
 from ..core.adaptation import get_training_status as _get_training_status
@@ -10,8 +11,8 @@ from ..core.planner import generate_plan
 from ..core.timeline import build_timeline
 from ..io.serializers import dict_to_session_plan, session_plan_to_dict
 from ._common import (
+    _load_user_state,
     _require_profile_store,
-    _require_store,
     _resolve_plan_start,
     _timeline_entry_to_dict,
     _total_weeks,
@@ -35,14 +36,18 @@ def get_plan(
     - ``overtraining``   -- overtraining severity dict (level, description, …)
     """
     exercise = get_exercise(exercise_id)
-    store = _require_store(data_dir, exercise_id)
-    user_state = store.load_user_state(exercise_id)
+    store, user_state = _load_user_state(data_dir, exercise_id)
 
-    plan_start_date = _resolve_plan_start(store, exercise_id, user_state.history)
-    total_weeks = _total_weeks(plan_start_date, weeks_ahead)
+    # One clock read per call: plan anchor, horizon and timeline status all
+    # agree on "today" even if the call straddles midnight.
+    now = datetime.now()
+    plan_start_date = _resolve_plan_start(store, exercise_id, user_state.history, now)
+    total_weeks = _total_weeks(plan_start_date, weeks_ahead, now)
 
     ot_severity = overtraining_severity(
-        user_state.history, user_state.profile.days_for_exercise(exercise_id)
+        user_state.history,
+        user_state.profile.days_for_exercise(exercise_id),
+        reference_date=now,
     )
     ot_level = ot_severity["level"]
 
@@ -52,8 +57,8 @@ def get_plan(
         eq_state.available_machine_assistance_kg if eq_state is not None else []
     )
 
-    cache = store.load_plan_result_cache(exercise_id)
     input_mtime = store._input_files_mtime(exercise_id)
+    cache = store.load_plan_result_cache(exercise_id, input_mtime)
     if cache is not None and cache.get("generated_at", 0.0) >= input_mtime:
         plans = [dict_to_session_plan(d) for d in cache["plans"]]
     else:
@@ -73,7 +78,7 @@ def get_plan(
         user_state.profile.bodyweight_kg,
     )
 
-    timeline = build_timeline(plans, user_state.history)
+    timeline = build_timeline(plans, user_state.history, now.date().isoformat())
 
     ff = training_status.fitness_fatigue_state
     return {
@@ -1,16 +1,17 @@
 """Profile management functions for the bar-scheduler API."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-from ..io.user_store import UserStore
 from ..io.serializers import (
     dict_to_user_profile,
     user_profile_to_dict,
 )
 from ._common import (
     ProfileAlreadyExistsError,
+    _get_store,
+    _load_profile_data,
+    _profile_not_found,
     _require_profile_store,
 )
 
@@ -46,11 +47,12 @@ def init_profile(
         language=language,
     )
 
-    store = UserStore(data_dir)
+    store = _get_store(data_dir)
     data_dir.mkdir(parents=True, exist_ok=True)
     store.save_profile(profile)
 
-    return get_profile(data_dir)
+    # Build the result from the in-memory profile rather than re-reading it.
+    return user_profile_to_dict(profile)
 
 
 def get_profile(data_dir: Path) -> dict | None:
@@ -59,7 +61,7 @@ def get_profile(data_dir: Path) -> dict | None:
 
     The dict includes all UserProfile fields including ``current_bodyweight_kg``.
     """
-    store = UserStore(data_dir)
+    store = _get_store(data_dir)
     profile = store.load_profile()
     if profile is None:
         return None
@@ -70,8 +72,13 @@ def update_bodyweight(data_dir: Path, bodyweight_kg: float) -> None:
     """Update the current bodyweight in profile.json."""
     if bodyweight_kg <= 0:
         raise ValueError("bodyweight_kg must be positive")
-    store = _require_profile_store(data_dir)
-    store.update_bodyweight(bodyweight_kg)
+    # The store opens profile.json directly; a missing file surfaces as
+    # FileNotFoundError without a separate existence check.
+    store = _get_store(data_dir)
+    try:
+        store.update_bodyweight(bodyweight_kg)
+    except FileNotFoundError:
+        raise _profile_not_found(store) from None
 
 
 def update_language(data_dir: Path, lang: str) -> None:
@@ -123,9 +130,7 @@ def update_profile(
     if language is not None and not language:
         raise ValueError("language must be a non-empty string")
 
-    store = _require_profile_store(data_dir)
-    with open(store.profile_path) as f:
-        data = json.load(f)
+    store, data = _load_profile_data(data_dir)
 
     if height_cm is not None:
         data["height_cm"] = height_cm
@@ -137,9 +142,8 @@ def update_profile(
         else:
             data["language"] = language
 
-    dict_to_user_profile(data)  # validate -- raises ValidationError if inconsistent
+    profile = dict_to_user_profile(data)  # validate -- raises ValidationError if inconsistent
 
-    with open(store.profile_path, "w") as f:
-        json.dump(data, f, indent=2)
+    store._write_profile_data(data)
 
-    return get_profile(data_dir)
+    return user_profile_to_dict(profile)
@@ -3,14 +3,20 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from ..core.adaptation import get_training_status as _get_training_status
-from ..core.equipment import compute_leff
+from ..core.equipment import (
+    TM_DEPENDENT_ITEMS,
+    compute_leff,
+    recommend_equipment_item,
+    snapshot_from_state,
+)
 from ..core.exercises.registry import get_exercise
-from ..core.metrics import best_1rm_from_leff
-from ..io.serializers import session_result_to_dict
+from ..core.metrics import training_max
+from ..core.models import SessionResult, SetResult
+from ..io.serializers import ValidationError, session_result_to_dict, validate_grip
 from ._common import (
     SessionNotFoundError,
     _require_store,
+    _session_performance_metrics,
 )
 from .types import SessionInput
 
@@ -31,100 +37,106 @@ def log_session(data_dir: Path, exercise_id: str, session: SessionInput) -> dict
     Returns the serialised session dict. The equipment snapshot is read from
     the profile and attached automatically.
     """
-    from ..core.equipment import recommend_equipment_item, snapshot_from_state
-    from ..core.planner.load_calculator import calculate_band_assistance, calculate_machine_assistance
-    from ..io.serializers import dict_to_session_result
-
+    # Validate the input before touching the filesystem: a malformed session
+    # fails without stat-ing the profile or history.  SessionInput/SetInput
+    # already checked type, bodyweight, set values and that the date parses,
+    # so the model objects are built directly instead of round-tripping
+    # through a dict.
+    validate_grip(session.grip)
+    # The models raise plain ValueError (e.g. for a non-zero-padded date that
+    # strptime accepted); keep the API's ValidationError contract.
+    try:
+        session_obj = SessionResult(
+            date=session.date,
+            bodyweight_kg=float(session.bodyweight_kg),
+            grip=session.grip,
+            session_type=session.session_type,
+            exercise_id=exercise_id,
+            completed_sets=[
+                SetResult(
+                    target_reps=int(s.reps),
+                    actual_reps=int(s.reps),
+                    rest_seconds_before=int(s.rest_seconds),
+                    added_weight_kg=float(s.added_weight_kg),
+                    rir_reported=int(s.rir_reported) if s.rir_reported is not None else None,
+                )
+                for s in session.sets
+            ],
+            notes=session.notes or None,
+        )
+    except ValueError as e:
+        raise ValidationError(str(e)) from e
     store = _require_store(data_dir, exercise_id)
-    session_obj = dict_to_session_result({
-        "date": session.date,
-        "bodyweight_kg": session.bodyweight_kg,
-        "grip": session.grip,
-        "session_type": session.session_type,
-        "exercise_id": exercise_id,
-        "completed_sets": [
-            {
-                "actual_reps": s.reps,
-                "rest_seconds_before": s.rest_seconds,
-                "added_weight_kg": s.added_weight_kg,
-                **({"rir_reported": s.rir_reported} if s.rir_reported is not None else {}),
-            }
-            for s in session.sets
-        ],
-        **({"notes": session.notes} if session.notes else {}),
-    })
+    ex = get_exercise(exercise_id)
+    # One profile read serves both the equipment lookup and the bodyweight
+    # check after the append.
+    profile_data = store._read_profile_data()
     if session_obj.equipment_snapshot is None:
-        eq_state = store.load_current_equipment(exercise_id)
+        eq_state = store._equipment_from_profile_data(profile_data, exercise_id)
         if eq_state is not None:
-            ex = get_exercise(exercise_id)
-            ustate = store.load_user_state(exercise_id)
-            current_tm = _get_training_status(
-                ustate.history, ustate.profile.bodyweight_kg
-            ).training_max
-            active_item = recommend_equipment_item(
-                eq_state.available_items, ex, current_tm
-            )
-            # Compute the prescribed assistance level for variable-assistance items.
             override_assistance: float | None = None
-            history = [s for s in ustate.history if s.exercise_id == exercise_id]
-            if active_item == "MACHINE_ASSISTED" and eq_state.available_machine_assistance_kg:
-                override_assistance = calculate_machine_assistance(
-                    ex,
-                    current_tm,
-                    ustate.profile.bodyweight_kg,
-                    history,
-                    session_obj.session_type,
-                    available_machine_assistance_kg=eq_state.available_machine_assistance_kg,
+            if TM_DEPENDENT_ITEMS.isdisjoint(eq_state.available_items):
+                # No belt or assistance device: the pick does not depend on
+                # training max, so skip loading the user state for it.
+                active_item = recommend_equipment_item(eq_state.available_items, ex, 0)
+            else:
+                # Deferred: importing the planner package loads the whole plan
+                # engine, which get_history/delete_session never need.
+                from ..core.planner.load_calculator import (
+                    calculate_band_assistance,
+                    calculate_machine_assistance,
                 )
-            elif active_item == "BAND_SET" and eq_state.available_band_assistance_kg:
-                override_assistance = calculate_band_assistance(
-                    ex,
-                    current_tm,
-                    ustate.profile.bodyweight_kg,
-                    history,
-                    session_obj.session_type,
-                    available_band_assistance_kg=eq_state.available_band_assistance_kg,
+
+                ustate = store.load_user_state(exercise_id)
+                current_tm = training_max(ustate.history)
+                active_item = recommend_equipment_item(
+                    eq_state.available_items, ex, current_tm
                 )
+                # Compute the prescribed assistance level for variable-assistance items.
+                history = [s for s in ustate.history if s.exercise_id == exercise_id]
+                if active_item == "MACHINE_ASSISTED" and eq_state.available_machine_assistance_kg:
+                    override_assistance = calculate_machine_assistance(
+                        ex,
+                        current_tm,
+                        ustate.profile.bodyweight_kg,
+                        history,
+                        session_obj.session_type,
+                        available_machine_assistance_kg=eq_state.available_machine_assistance_kg,
+                    )
+                elif active_item == "BAND_SET" and eq_state.available_band_assistance_kg:
+                    override_assistance = calculate_band_assistance(
+                        ex,
+                        current_tm,
+                        ustate.profile.bodyweight_kg,
+                        history,
+                        session_obj.session_type,
+                        available_band_assistance_kg=eq_state.available_band_assistance_kg,
+                    )
             session_obj.equipment_snapshot = snapshot_from_state(
                 eq_state, active_item, override_assistance_kg=override_assistance
             )
     # Compute and cache performance metrics at log time.
-    ex = get_exercise(exercise_id)
     assistance_kg = (
         session_obj.equipment_snapshot.assistance_kg
         if session_obj.equipment_snapshot is not None
         else 0.0
     )
-    leff_reps = [
-        (
-            compute_leff(
-                ex.bw_fraction,
-                session_obj.bodyweight_kg,
-                s.added_weight_kg,
-                assistance_kg,
-            ),
-            s.actual_reps,
-        )
+    # Fed straight into the metrics accumulator: one pass over the sets,
+    # no intermediate (leff, reps) list.
+    bw_fraction = ex.bw_fraction
+    bodyweight_kg = session_obj.bodyweight_kg
+    session_obj.session_metrics = _session_performance_metrics(
+        (compute_leff(bw_fraction, bodyweight_kg, s.added_weight_kg, assistance_kg), reps)
         for s in session_obj.completed_sets
-        if s.actual_reps is not None and s.actual_reps > 0
-    ]
-    volumes = [leff * reps for leff, reps in leff_reps]
-    n = len(volumes)
-    volume_session = sum(volumes)
-    avg_volume_set = volume_session / n if n > 0 else 0.0
-    best_1rm: float | None = None
-    for leff, reps in leff_reps:
-        est = best_1rm_from_leff(leff, reps)
-        if est is not None and (best_1rm is None or est > best_1rm):
-            best_1rm = est
-    session_obj.session_metrics = {
-        "volume_session": round(volume_session, 2),
-        "avg_volume_set": round(avg_volume_set, 2),
-        "estimated_1rm": round(best_1rm, 2) if best_1rm is not None else None,
-    }
+        if (reps := s.actual_reps)
+    )
 
     store.append_session(session_obj)
-    store.update_bodyweight(session_obj.bodyweight_kg)
+    if (
+        profile_data is None
+        or profile_data.get("current_bodyweight_kg") != session_obj.bodyweight_kg
+    ):
+        store.update_bodyweight(session_obj.bodyweight_kg)
     return session_result_to_dict(session_obj)
 
 
@@ -135,26 +147,40 @@ def delete_session(data_dir: Path, exercise_id: str, index: int) -> None:
     Raises ``SessionNotFoundError`` if ``index`` is out of range.
     """
     store = _require_store(data_dir, exercise_id)
-    sessions = store.load_history(exercise_id)
-    zero_based = index - 1
-    if zero_based < 0 or zero_based >= len(sessions):
+    # delete_session_at bounds-checks against the history it loads; only the
+    # error path needs the session count, so avoid a second full load here.
+    try:
+        store.delete_session_at(exercise_id, index - 1)
+    except IndexError:
+        total = len(store.load_history(exercise_id))
         raise SessionNotFoundError(
-            f"Session {index} not found (history has {len(sessions)} sessions)."
-        )
-    store.delete_session_at(exercise_id, zero_based)
+            f"Session {index} not found (history has {total} sessions)."
+        ) from None
 
 
-def get_history(data_dir: Path, exercise_id: str) -> list[dict]:
+def get_history(
+    data_dir: Path, exercise_id: str, limit: int | None = None
+) -> list[dict]:
     """
     Return the full session history as a list of dicts, sorted by date.
 
+    Pass ``limit`` to get only the ``limit`` most recent sessions; only those
+    lines of the history file are parsed.
+
     Each dict includes a ``session_metrics`` key with pre-computed performance
     metrics (``volume_session``, ``avg_volume_set``, ``estimated_1rm``).
     For sessions logged before metrics caching was introduced, all values are
     ``None``.
+
+    Raises ``ValueError`` if ``limit`` is not positive.
     """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be positive, got {limit}")
     store = _require_store(data_dir, exercise_id)
-    sessions = store.load_history(exercise_id)
+    if limit is None:
+        sessions = store.load_history(exercise_id)
+    else:
+        sessions = store.load_history_tail(exercise_id, limit)
     result = []
     for s in sessions:
         d = session_result_to_dict(s)
@@ -1,9 +1,10 @@
 """Public input types for the bar-scheduler API."""
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, get_args
 
 SessionType = Literal["S", "H", "E", "T", "TEST"]
+_VALID_SESSION_TYPES: frozenset[str] = frozenset(get_args(SessionType))
 
 @dataclass
 class SetInput:
@@ -31,13 +32,15 @@ class SessionInput:
     notes: str = ""
 
     def __post_init__(self) -> None:
+        # Scalar guards first; the date parse is the only non-trivial check.
+        if self.bodyweight_kg <= 0:
+            raise ValueError("SessionInput.bodyweight_kg must be > 0")
+        if self.session_type not in _VALID_SESSION_TYPES:
+            raise ValueError(
+                f"SessionInput.session_type must be one of {get_args(SessionType)}"
+            )
         from datetime import datetime
         try:
             datetime.strptime(self.date, "%Y-%m-%d")
         except ValueError:
             raise ValueError(f"SessionInput.date must be YYYY-MM-DD, got {self.date!r}")
-        valid_types = {"S", "H", "E", "T", "TEST"}
-        if self.session_type not in valid_types:
-            raise ValueError(f"SessionInput.session_type must be one of {valid_types}")
-        if self.bodyweight_kg <= 0:
-            raise ValueError("SessionInput.bodyweight_kg must be > 0")
@@ -24,8 +24,11 @@ from .config import (
 )
 from .metrics import (
     get_test_sessions,
+    latest_test_max,
     overall_max_reps,
     session_max_reps,
+    training_max,
+    training_max_from_baseline,
     trend_slope_per_week,
     weekly_compliance,
 )
@@ -58,13 +61,13 @@ def detect_plateau(history: list[SessionResult]) -> bool:
         return False
 
     # Check for new best in window
-    latest_date = datetime.strptime(test_sessions[-1].date, "%Y-%m-%d")
+    latest_date = datetime.fromisoformat(test_sessions[-1].date)
     cutoff = latest_date - timedelta(days=PLATEAU_WINDOW_DAYS)
 
     best_ever = overall_max_reps(history)
 
     recent_tests = [
-        s for s in test_sessions if datetime.strptime(s.date, "%Y-%m-%d") >= cutoff
+        s for s in test_sessions if datetime.fromisoformat(s.date) >= cutoff
     ]
 
     for session in recent_tests:
@@ -248,8 +251,6 @@ def get_training_status(
     Returns:
         TrainingStatus with all metrics
     """
-    from .metrics import latest_test_max, training_max
-
     # Build fitness-fatigue state
     ff_state, _ = build_fitness_fatigue_state(history, current_bodyweight_kg, baseline_max)
 
@@ -261,8 +262,6 @@ def get_training_status(
     # Calculate training max
     tm = training_max(history)
     if tm == 1 and baseline_max is not None:
-        from .metrics import training_max_from_baseline
-
         tm = training_max_from_baseline(baseline_max)
 
     # Calculate trend
@@ -370,12 +369,12 @@ def overtraining_severity(
     )
     cutoff = ref - timedelta(days=6)  # 7-day window ending today
 
-    recent = [s for s in history if datetime.strptime(s.date, "%Y-%m-%d") >= cutoff]
+    recent = [s for s in history if datetime.fromisoformat(s.date) >= cutoff]
     n = len(recent)
     if n < 2:
         return _empty
 
-    dates = sorted(datetime.strptime(s.date, "%Y-%m-%d") for s in recent)
+    dates = sorted(datetime.fromisoformat(s.date) for s in recent)
     span_days = (dates[-1] - dates[0]).days  # 0 = all on same day
 
     # Expected time to complete n sessions at the user's planned frequency.
@@ -16,7 +16,7 @@ errors, a warning is printed and the file is ignored.
 
 from __future__ import annotations
 
-import importlib.resources
+import functools
 import os
 from pathlib import Path
 from typing import Any
@@ -26,6 +26,20 @@ from typing import Any
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
+def yaml_safe_loader() -> Any:
+    """
+    Return PyYAML's safe loader class, preferring libyaml's C loader.
+
+    Parsing the bundled YAML dominates import time of the package, so the C
+    loader is used whenever PyYAML was built with it.  Shared by every YAML
+    reader in the package; raises ImportError if PyYAML is missing.
+    """
+    import yaml  # type: ignore
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def _load_yaml_file(path: Path) -> dict[str, Any]:
     """Load a single YAML file; return {} on any error."""
     try:
@@ -34,7 +48,7 @@ def _load_yaml_file(path: Path) -> dict[str, Any]:
         return {}
     try:
         with open(path, "r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+            data = yaml.load(fh, Loader=yaml_safe_loader())
             return data if isinstance(data, dict) else {}
     except Exception:
         return {}
@@ -58,17 +72,22 @@ def _deep_merge(base: dict, override: dict) -> dict:
 
 def get_bundled_yaml_path() -> Path | None:
     """Return the path to the bundled exercises.yaml, or None if not found."""
+    # Regular installs ship the file next to the package; resolving it
+    # directly avoids importing importlib.resources on every start-up.
+    candidate = Path(__file__).parent.parent.parent / "exercises.yaml"
+    if candidate.exists():
+        return candidate
     try:
-        # Python ≥3.9: importlib.resources.files
+        # Zipped or otherwise non-filesystem installs: importlib.resources.files
+        import importlib.resources
+
         pkg_files = importlib.resources.files("bar_scheduler")
         ref = pkg_files.joinpath("exercises.yaml")
         # Materialise to a real path so we can pass it to open()
         with importlib.resources.as_file(ref) as p:
             return p
     except Exception:
-        # Fallback: look relative to this file's package root
-        candidate = Path(__file__).parent.parent.parent / "exercises.yaml"
-        return candidate if candidate.exists() else None
+        return None
 
 
 def get_user_yaml_path() -> Path | None:
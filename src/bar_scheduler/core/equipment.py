@@ -29,7 +29,6 @@ user-spec v2026-02-24.
 from __future__ import annotations
 
 from .exercises.base import ExerciseDefinition
-from .exercises.registry import get_exercise
 from .models import EquipmentState, EquipmentSnapshot
 
 
@@ -44,6 +43,10 @@ def get_catalog(exercise_id: str) -> dict[str, dict]:
     The catalog is loaded from the per-exercise YAML file via the exercise
     registry.  Returns {} for unknown exercise IDs.
     """
+    # Imported here: loading the registry parses every exercise YAML, which
+    # callers that only need the helpers below should not pay for.
+    from .exercises.registry import get_exercise
+
     try:
         return get_exercise(exercise_id).equipment
     except ValueError:
@@ -76,10 +79,10 @@ def get_assistance_kg(
     Returns:
         Assistance in kg (≥ 0)
     """
-    catalog = get_catalog(exercise_id)
-    if item_id not in catalog:
+    item = get_catalog(exercise_id).get(item_id)
+    if item is None:
         return 0.0
-    a = catalog[item_id]["assistance_kg"]
+    a = item["assistance_kg"]
     if a is None:
         if item_id == "BAND_SET":
             return max(available_band_assistance_kg) if available_band_assistance_kg else 0.0
@@ -146,6 +149,13 @@ def snapshot_from_state(
     )
 
 
+# Items whose selection (belt threshold) or prescription (assistance level)
+# depends on the training max.  Without any of these the pick is TM-independent.
+TM_DEPENDENT_ITEMS: frozenset[str] = frozenset(
+    {"WEIGHT_BELT", "MACHINE_ASSISTED", "BAND_SET"}
+)
+
+
 def recommend_equipment_item(
     available_items: list[str],
     exercise: ExerciseDefinition,
@@ -168,24 +178,25 @@ def recommend_equipment_item(
     Returns:
         Item ID string (e.g. "WEIGHT_BELT", "BAND_SET", "BAR_ONLY").
     """
-    catalog = get_catalog(exercise.exercise_id)
+    catalog = exercise.equipment
+    owned = frozenset(available_items)  # repeated membership checks below
 
     # 1. Weighted phase: use WEIGHT_BELT when TM has crossed the weight threshold
     if (
         current_tm > exercise.weight_tm_threshold
-        and "WEIGHT_BELT" in available_items
+        and "WEIGHT_BELT" in owned
         and "WEIGHT_BELT" in catalog
     ):
         return "WEIGHT_BELT"
 
     # 2. Assisted items: MACHINE_ASSISTED and BAND_SET use the same model
     for candidate in ("MACHINE_ASSISTED", "BAND_SET"):
-        if candidate in available_items and candidate in catalog:
+        if candidate in owned and candidate in catalog:
             return candidate
 
     # 3. Fallback: first item in the exercise catalog that the user has
     for item in catalog:
-        if item in available_items:
+        if item in owned:
             return item
 
     return "BAR_ONLY"
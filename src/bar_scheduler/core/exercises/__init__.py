@@ -3,10 +3,15 @@ Exercise definitions for bar-scheduler.
 
 Each exercise is described by an ExerciseDefinition object that
 parameterises the shared planning engine.
+
+The registry (which parses the bundled YAML files) is imported on first
+access to ``EXERCISE_REGISTRY`` or ``get_exercise``, so modules that only
+need the ``base`` types do not pay for loading every exercise.
 """
 
+from typing import Any
+
 from .base import ExerciseDefinition, SessionTypeParams
-from .registry import EXERCISE_REGISTRY, get_exercise
 
 __all__ = [
     "ExerciseDefinition",
@@ -14,3 +19,11 @@ __all__ = [
     "EXERCISE_REGISTRY",
     "get_exercise",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("EXERCISE_REGISTRY", "get_exercise"):
+        from . import registry
+
+        return getattr(registry, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,6 +21,7 @@ import os
 import warnings
 from pathlib import Path
 
+from ..engine.config_loader import yaml_safe_loader
 from .base import ExerciseDefinition, SessionTypeParams
 
 _REQUIRED_SESSION_PARAMS: frozenset[str] = frozenset(
@@ -156,7 +157,7 @@ def _load_yaml_file(path: Path) -> dict:
         return {}
     try:
         with open(path, "r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+            data = yaml.load(fh, Loader=yaml_safe_loader())
             return data if isinstance(data, dict) else {}
     except Exception:
         return {}
@@ -44,7 +44,10 @@ def get_exercise(exercise_id: str) -> ExerciseDefinition:
     Raises:
         ValueError: If exercise_id is not in the registry
     """
-    if exercise_id not in EXERCISE_REGISTRY:
+    try:
+        return EXERCISE_REGISTRY[exercise_id]
+    except KeyError:
         valid = ", ".join(EXERCISE_REGISTRY)
-        raise ValueError(f"Unknown exercise '{exercise_id}'. Valid IDs: {valid}")
-    return EXERCISE_REGISTRY[exercise_id]
+        raise ValueError(
+            f"Unknown exercise '{exercise_id}'. Valid IDs: {valid}"
+        ) from None
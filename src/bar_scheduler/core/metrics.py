@@ -174,17 +174,22 @@ def session_max_reps(session: SessionResult) -> int:
     Returns:
         Max reps from bodyweight-only sets (or all sets if no BW-only), or 0
     """
-    bw_only_sets = [
-        s
-        for s in session.completed_sets
-        if s.actual_reps is not None and s.added_weight_kg == 0
-    ]
-
-    if bw_only_sets:
-        return max(s.actual_reps for s in bw_only_sets)  # type: ignore
-
-    all_sets = [s for s in session.completed_sets if s.actual_reps is not None]
-    return max((s.actual_reps for s in all_sets), default=0)  # type: ignore
+    # Single pass over the sets; no intermediate lists or generators.
+    best_bw: int | None = None
+    best_weighted: int | None = None
+    for s in session.completed_sets:
+        reps = s.actual_reps
+        if reps is None:
+            continue
+        if s.added_weight_kg == 0:
+            if best_bw is None or reps > best_bw:
+                best_bw = reps
+        elif best_weighted is None or reps > best_weighted:
+            best_weighted = reps
+
+    if best_bw is not None:
+        return best_bw
+    return best_weighted if best_weighted is not None else 0
 
 
 def session_total_reps(session: SessionResult) -> int:
@@ -605,11 +610,11 @@ def trend_slope_per_week(
 
     # Filter to window
     if test_sessions:
-        latest_date = datetime.strptime(test_sessions[-1].date, "%Y-%m-%d")
+        latest_date = datetime.fromisoformat(test_sessions[-1].date)
         cutoff = latest_date - timedelta(days=window_days)
 
         filtered = [
-            s for s in test_sessions if datetime.strptime(s.date, "%Y-%m-%d") >= cutoff
+            s for s in test_sessions if datetime.fromisoformat(s.date) >= cutoff
         ]
     else:
         filtered = []
@@ -618,9 +623,9 @@ def trend_slope_per_week(
         return 0.0
 
     # Convert to day indices
-    base_date = datetime.strptime(filtered[0].date, "%Y-%m-%d")
+    base_date = datetime.fromisoformat(filtered[0].date)
     points = [
-        ((datetime.strptime(s.date, "%Y-%m-%d") - base_date).days, session_max_reps(s))
+        ((datetime.fromisoformat(s.date) - base_date).days, session_max_reps(s))
         for s in filtered
     ]
 
@@ -684,10 +689,10 @@ def weekly_compliance(history: list[SessionResult], weeks_back: int = 1) -> floa
     if not history:
         return 1.0
 
-    latest_date = datetime.strptime(history[-1].date, "%Y-%m-%d")
+    latest_date = datetime.fromisoformat(history[-1].date)
     cutoff = latest_date - timedelta(days=weeks_back * 7)
 
-    recent = [s for s in history if datetime.strptime(s.date, "%Y-%m-%d") >= cutoff]
+    recent = [s for s in history if datetime.fromisoformat(s.date) >= cutoff]
 
     if not recent:
         return 1.0
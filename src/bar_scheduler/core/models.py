@@ -6,16 +6,23 @@ Grip/variant values are exercise-specific strings; validation is delegated
 to ExerciseDefinition rather than enforced at the model level.
 """
 
+import math
+import re
 from dataclasses import dataclass, field
-from typing import Literal
+from datetime import datetime
+from typing import Literal, get_args
 
 # Grip is now a plain str to support non-pull-up variant names
 # (e.g. "standard", "chest_lean" for dips; "deficit" for BSS).
 Grip = str
 SessionType = Literal["S", "H", "E", "T", "TEST"]
+SESSION_TYPES: frozenset[str] = frozenset(get_args(SessionType))
+VALID_DAYS_PER_WEEK: frozenset[int] = frozenset(range(1, 6))  # per-exercise frequency
 
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")  # ISO YYYY-MM-DD layout
 
-@dataclass
+
+@dataclass(slots=True)
 class SetResult:
     """
     A single set within a training session.
@@ -46,7 +53,7 @@ class SetResult:
             raise ValueError("rir_reported must be non-negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class PlannedSet:
     """
     A planned set for a future session.
@@ -127,7 +134,7 @@ class EquipmentState:
     # the smallest available value ≥ the computed ideal.
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionResult:
     """
     A completed or partially completed training session.
@@ -156,27 +163,24 @@ class SessionResult:
 
         # Grip validation is exercise-specific; not enforced here.
 
-        if self.session_type not in ("S", "H", "E", "T", "TEST"):
+        if self.session_type not in SESSION_TYPES:
             raise ValueError(f"Invalid session_type: {self.session_type}")
 
     @staticmethod
     def _validate_date(date_str: str) -> None:
         """Validate date string is ISO format YYYY-MM-DD."""
-        import re
-
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
+        if not DATE_RE.match(date_str):
             raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD")
 
-        # Also check it's a valid date
-        from datetime import datetime
-
+        # Also check it's a valid date.  The regex already pinned the exact
+        # layout, so the C-level ISO parser is as strict as strptime here.
         try:
-            datetime.strptime(date_str, "%Y-%m-%d")
+            datetime.fromisoformat(date_str)
         except ValueError as e:
             raise ValueError(f"Invalid date: {date_str}") from e
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionPlan:
     """
     A planned future training session.
@@ -197,7 +201,7 @@ class SessionPlan:
         """Validate session plan data."""
         SessionResult._validate_date(self.date)
         # Grip validation is exercise-specific; not enforced here.
-        if self.session_type not in ("S", "H", "E", "T", "TEST"):
+        if self.session_type not in SESSION_TYPES:
             raise ValueError(f"Invalid session_type: {self.session_type}")
 
     @property
@@ -242,7 +246,7 @@ class ExerciseTarget:
         return f"{self.reps} reps"
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """
     User profile with physical characteristics and preferences.
@@ -282,7 +286,7 @@ class UserProfile:
             raise ValueError("bodyweight_kg must be positive")
 
         for ex_id, days in self.exercise_days.items():
-            if days not in (1, 2, 3, 4, 5):
+            if days not in VALID_DAYS_PER_WEEK:
                 raise ValueError(
                     f"exercise_days[{ex_id!r}] must be 1–5, got {days}"
                 )
@@ -330,8 +334,6 @@ class FitnessFatigueState:
         """Calculate readiness z-score for autoregulation."""
         if self.readiness_var <= 0:
             return 0.0
-        import math
-
         std = math.sqrt(self.readiness_var)
         if std == 0:
             return 0.0
@@ -386,7 +386,7 @@ def build_fitness_fatigue_state(
     prev_date: datetime | None = None
 
     for session in history:
-        curr_date = datetime.strptime(session.date, "%Y-%m-%d")
+        curr_date = datetime.fromisoformat(session.date)
 
         # Calculate days since last
         if prev_date is not None:
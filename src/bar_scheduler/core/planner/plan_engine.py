@@ -116,7 +116,7 @@ def _plan_core(
     if not history:
         today = datetime.strptime(start_date, "%Y-%m-%d") - timedelta(days=1)
         synthetic = create_synthetic_test_session(
-            today.strftime("%Y-%m-%d"),
+            today.date().isoformat(),
             user_state.profile.bodyweight_kg,
             baseline_max,  # type: ignore
             exercise.exercise_id,
@@ -177,7 +177,7 @@ def _plan_core(
         s for s in user_state.history if s.exercise_id == exercise.exercise_id
     ]
     first_date: datetime | None = (
-        datetime.strptime(original_history[0].date, "%Y-%m-%d")
+        datetime.fromisoformat(original_history[0].date)
         if original_history
         else None
     )
@@ -206,7 +206,7 @@ def _plan_core(
     density_sessions_left = overtraining_level  # level = number of sessions to affect
 
     for date, session_type in session_dates:
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = date.date().isoformat()
         session_week_idx = (date - start).days // 7
 
         # Apply weekly TM progression exactly once per calendar-week boundary
@@ -417,7 +417,7 @@ def estimate_plan_completion_date(
     weeks = estimate_weeks_to_target(tm, exercise_target.reps)
     estimated_date = datetime.now() + timedelta(weeks=weeks)
 
-    return estimated_date.strftime("%Y-%m-%d")
+    return estimated_date.date().isoformat()
 
 
 def format_plan_summary(plans: list[SessionPlan]) -> str:
@@ -437,7 +437,7 @@ def format_plan_summary(plans: list[SessionPlan]) -> str:
     current_week = None
 
     for plan in plans:
-        date = datetime.strptime(plan.date, "%Y-%m-%d")
+        date = datetime.fromisoformat(plan.date)
         week_num = date.isocalendar()[1]
 
         if current_week != week_num:
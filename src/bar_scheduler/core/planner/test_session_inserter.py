@@ -27,7 +27,7 @@ def _find_last_test(
     """
     test_hist = [s for s in history if s.session_type == "TEST"]
     if test_hist:
-        return datetime.strptime(test_hist[-1].date, "%Y-%m-%d")
+        return datetime.fromisoformat(test_hist[-1].date)
     # Treat plan start as if a test was due right before (trigger at first week boundary)
     return plan_start - timedelta(days=test_frequency_weeks * 7)
 
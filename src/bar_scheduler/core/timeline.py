@@ -6,7 +6,8 @@ TimelineEntry objects suitable for display by any client (CLI, Telegram, web).
 """
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from operator import attrgetter
 from typing import Literal
 
 from .max_estimator import estimate_max_reps_from_session
@@ -14,6 +15,8 @@ from .models import SessionPlan, SessionResult
 
 TimelineStatus = Literal["done", "missed", "next", "planned", "extra"]
 
+_by_date = attrgetter("date")
+
 
 @dataclass
 class TimelineEntry:
@@ -31,6 +34,7 @@ class TimelineEntry:
 def build_timeline(
     plans: list[SessionPlan],
     history: list[SessionResult],
+    today: str | None = None,
 ) -> list[TimelineEntry]:
     """
     Merge plan + history into a unified chronological timeline.
@@ -42,17 +46,19 @@ def build_timeline(
     Args:
         plans: Generated plan entries (may include past dates)
         history: Logged sessions
+        today: ISO date treated as today (defaults to the current date)
 
     Returns:
         Sorted list of TimelineEntry
     """
-    today = datetime.now().strftime("%Y-%m-%d")
+    if today is None:
+        today = date.today().isoformat()
 
     # Stable week-number anchor: Monday of the week containing the first real session.
     # Anchoring to Monday means Mon-Sun calendar weeks stay together (e.g. sessions
     # on Mon 03.02 and Wed 03.04 both appear as "week 3", not split across weeks).
     first_date: datetime | None = (
-        datetime.strptime(min(s.date for s in history), "%Y-%m-%d") if history else None
+        datetime.fromisoformat(min(s.date for s in history)) if history else None
     )
     first_monday: datetime | None = (
         first_date - timedelta(days=first_date.weekday())
@@ -145,7 +151,7 @@ def build_timeline(
     # Add any extra (unplanned) history sessions not matched to a plan
     for orig_i, s in enumerate(history):
         if orig_i not in matched_indices:
-            session_dt = datetime.strptime(s.date, "%Y-%m-%d")
+            session_dt = datetime.fromisoformat(s.date)
             wn = (session_dt - first_monday).days // 7 + 1 if first_monday else 0
             entries.append(
                 TimelineEntry(
@@ -158,5 +164,5 @@ def build_timeline(
                 )
             )
 
-    entries.sort(key=lambda e: e.date)
+    entries.sort(key=_by_date)
     return entries
@@ -0,0 +1,38 @@
+"""
+JSON encoding helpers for the storage layer.
+
+Uses orjson when it is installed (``pip install bar-scheduler[fast]``) and
+falls back to the stdlib json module otherwise.  Encoders return bytes so
+callers can hand the whole document to a single ``write()``; ``loads``
+accepts bytes or str.  Decode errors are ``json.JSONDecodeError`` in both
+cases (orjson's error type subclasses it).
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize ``obj`` as 2-space indented JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2) + "\n").encode()
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """Serialize ``obj`` as a single compact JSON line (no trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
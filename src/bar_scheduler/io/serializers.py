@@ -7,9 +7,12 @@ Handles conversion between dataclasses and JSON-compatible dicts.
 import json
 import re
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, get_args
 
 from ..core.models import (
+    DATE_RE,
+    SESSION_TYPES,
     EquipmentSnapshot,
     EquipmentState,
     ExerciseTarget,
@@ -21,6 +24,7 @@ from ..core.models import (
     SetResult,
     UserProfile,
 )
+from ._json import dumps_compact, loads
 
 
 class ValidationError(Exception):
@@ -42,11 +46,12 @@ def validate_date(date_str: str) -> str:
     Raises:
         ValidationError: If date format is invalid
     """
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
+    if not DATE_RE.match(date_str):
         raise ValidationError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD")
 
+    # The regex pins the layout; fromisoformat then only checks the calendar.
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        datetime.fromisoformat(date_str)
     except ValueError as e:
         raise ValidationError(f"Invalid date: {date_str}") from e
 
@@ -88,10 +93,9 @@ def validate_session_type(session_type: str) -> SessionType:
     Raises:
         ValidationError: If session type is invalid
     """
-    valid_types = ("S", "H", "E", "T", "TEST")
-    if session_type not in valid_types:
+    if session_type not in SESSION_TYPES:
         raise ValidationError(
-            f"Invalid session_type: {session_type}. Must be one of {valid_types}"
+            f"Invalid session_type: {session_type}. Must be one of {get_args(SessionType)}"
         )
     return session_type  # type: ignore
 
@@ -344,8 +348,9 @@ def session_result_to_dict(session: SessionResult) -> dict[str, Any]:
     if session.equipment_snapshot is not None:
         d["equipment_snapshot"] = equipment_snapshot_to_dict(session.equipment_snapshot)
     # Only include session_metrics when present (cached at log time)
+    # Copied: parsed sessions are shared through the history cache.
     if session.session_metrics is not None:
-        d["session_metrics"] = session.session_metrics
+        d["session_metrics"] = dict(session.session_metrics)
     return d
 
 
@@ -474,8 +479,7 @@ def session_to_json_line(session: SessionResult) -> str:
     Returns:
         JSON string (single line, no trailing newline)
     """
-    data = session_result_to_dict(session)
-    return json.dumps(data, separators=(",", ":"))
+    return dumps_compact(session_result_to_dict(session)).decode()
 
 
 def json_line_to_session(line: str) -> SessionResult:
@@ -492,7 +496,7 @@ def json_line_to_session(line: str) -> SessionResult:
         ValidationError: If JSON is invalid or data validation fails
     """
     try:
-        data = json.loads(line.strip())
+        data = loads(line.strip())
     except json.JSONDecodeError as e:
         raise ValidationError(f"Invalid JSON: {e}") from e
 
@@ -501,6 +505,41 @@ def json_line_to_session(line: str) -> SessionResult:
 
 _DEFAULT_REST_SECONDS = 180  # Used when rest is omitted from a set
 
+# Compact plan format pieces used by parse_compact_sets
+_COMPACT_X_RE = re.compile(r"[xX×]")
+_COMPACT_REST_RE = re.compile(r"\s*/\s*(\d+)\s*s\s*$")  # trailing "/ Ns"
+_COMPACT_WEIGHT_RE = re.compile(r"\+\s*([0-9]+(?:\.[0-9]+)?)\s*kg\s*$", re.IGNORECASE)
+_COMPACT_GROUP_RE = re.compile(r"(\d+)\s*[xX×]\s*(\d+)")  # NxM
+
+# One pattern for every per-set format accepted by parse_sets_string:
+#   reps@+weight[/rest]  or  reps weight [rest]
+_SET_RE = re.compile(
+    r"^(?P<reps>\d+)"
+    r"(?:@\+?(?P<at_weight>-?\d+\.?\d*)(?:/(?P<at_rest>\d+))?"
+    r"|\s+(?P<sp_weight>\+?-?\d+\.?\d*)(?:\s+(?P<sp_rest>\d+))?)$"
+)
+
+
+def _split_at_set(part: str) -> tuple[int, float, int] | None:
+    """
+    Parse a canonical ``reps@[+]weight[/rest]`` token with str methods only.
+
+    Accepts exactly what the ``@`` branch of ``_SET_RE`` accepts and returns
+    None for anything else, so callers can fall back to the regex.
+    """
+    reps_s, at, tail = part.partition("@")
+    if not at or not reps_s.isdecimal():
+        return None
+    weight_s, slash, rest_s = tail.partition("/")
+    if slash and not rest_s.isdecimal():
+        return None
+    w = weight_s.removeprefix("+").removeprefix("-")
+    int_part, _, frac = w.partition(".")
+    if not int_part.isdecimal() or (frac and not frac.isdecimal()):
+        return None
+    rest = int(rest_s) if slash else _DEFAULT_REST_SECONDS
+    return int(reps_s), float(weight_s.removeprefix("+")), rest
+
 
 def parse_compact_sets(s: str) -> list[tuple[int, float, int]] | None:
     """
@@ -527,21 +566,20 @@ def parse_compact_sets(s: str) -> list[tuple[int, float, int]] | None:
 
     # Require at least one 'x'/'×' OR a shared rest suffix '/ Ns' to be compact.
     # Per-set formats embed rest without a trailing 's' (e.g. "8@0/180"), so this is safe.
-    has_x = bool(re.search(r"[xX×]", text))
-    has_rest_suffix = bool(re.search(r"/\s*\d+\s*s\s*$", text))
-    if not has_x and not has_rest_suffix:
+    rest_match = _COMPACT_REST_RE.search(text)
+    if rest_match is None and _COMPACT_X_RE.search(text) is None:
         return None
 
     # Extract optional rest suffix:  / Ns
     rest = _DEFAULT_REST_SECONDS
-    m = re.search(r"\s*/\s*(\d+)\s*s\s*$", text)
+    m = rest_match
     if m:
         rest = int(m.group(1))
         text = text[: m.start()].strip()
 
     # Extract optional weight prefix on the right:  +W.Wkg
     weight = 0.0
-    m = re.search(r"\+\s*([0-9]+(?:\.[0-9]+)?)\s*kg\s*$", text, re.IGNORECASE)
+    m = _COMPACT_WEIGHT_RE.search(text)
     if m:
         weight = float(m.group(1))
         text = text[: m.start()].strip()
@@ -554,7 +592,7 @@ def parse_compact_sets(s: str) -> list[tuple[int, float, int]] | None:
     result: list[tuple[int, float, int]] = []
     for group in groups:
         # NxM / N×M -> N reps × M sets
-        m = re.fullmatch(r"(\d+)\s*[xX×]\s*(\d+)", group)
+        m = _COMPACT_GROUP_RE.fullmatch(group)
         if m:
             n_reps = int(m.group(1))
             n_sets = int(m.group(2))
@@ -564,9 +602,8 @@ def parse_compact_sets(s: str) -> list[tuple[int, float, int]] | None:
                 result.append((n_reps, weight, rest))
             continue
         # Bare integer -> 1 set of N reps
-        m = re.fullmatch(r"(\d+)", group)
-        if m:
-            result.append((int(m.group(1)), weight, rest))
+        if group.isdecimal():
+            result.append((int(group), weight, rest))
             continue
         # Unknown group -- not compact format
         return None
@@ -599,57 +636,53 @@ def parse_sets_string(sets_str: str) -> list[tuple[int, float, int]]:
 
     Raises:
         ValidationError: If format is invalid
+
+    Results are memoized per input string (clients often re-submit the same
+    string); each call returns a fresh list.
     """
+    return list(_parse_sets_string_cached(sets_str))
+
+
+@lru_cache(maxsize=256)
+def _parse_sets_string_cached(sets_str: str) -> tuple[tuple[int, float, int], ...]:
+    """Memoized body of parse_sets_string; returns an immutable tuple."""
     if not sets_str or not sets_str.strip():
         raise ValidationError("Sets string cannot be empty")
 
     # Try compact plan format first (e.g. "4x5 +0.5kg / 240s")
     compact = parse_compact_sets(sets_str.strip())
     if compact is not None:
-        return compact
+        return tuple(compact)
 
     sets: list[tuple[int, float, int]] = []
     parts = [p.strip() for p in sets_str.split(",") if p.strip()]
 
     for part in parts:
-        # Try formats in priority order:
-        # 1. reps@+weight/rest  (canonical with rest)
-        # 2. reps@+weight       (canonical, rest omitted)
-        # 3. reps weight rest   (space-separated)
-        # 4. reps weight        (space-separated, rest omitted)
-        # 5. reps               (bare integer, weight=0)
-        match_at_rest = re.match(r"^(\d+)@\+?(-?\d+\.?\d*)/(\d+)$", part)
-        match_at = re.match(r"^(\d+)@\+?(-?\d+\.?\d*)$", part)
-        match_sp_rest = re.match(r"^(\d+)\s+(\+?-?\d+\.?\d*)\s+(\d+)$", part)
-        match_sp = re.match(r"^(\d+)\s+(\+?-?\d+\.?\d*)$", part)
-        match_bare = re.match(r"^(\d+)$", part)
-
-        if match_at_rest:
-            reps = int(match_at_rest.group(1))
-            weight = float(match_at_rest.group(2))
-            rest = int(match_at_rest.group(3))
-        elif match_at:
-            reps = int(match_at.group(1))
-            weight = float(match_at.group(2))
-            rest = _DEFAULT_REST_SECONDS
-        elif match_sp_rest:
-            reps = int(match_sp_rest.group(1))
-            weight = float(match_sp_rest.group(2))
-            rest = int(match_sp_rest.group(3))
-        elif match_sp:
-            reps = int(match_sp.group(1))
-            weight = float(match_sp.group(2))
-            rest = _DEFAULT_REST_SECONDS
-        elif match_bare:
-            reps = int(match_bare.group(1))
-            weight = 0.0
-            rest = _DEFAULT_REST_SECONDS
+        # Bare integer (the common case) needs no regex: weight=0, default rest
+        if part.isdecimal():
+            sets.append((int(part), 0.0, _DEFAULT_REST_SECONDS))
+            continue
+
+        # Canonical reps@weight/rest tokens skip the regex engine.
+        parsed = _split_at_set(part)
+        if parsed is not None:
+            reps, weight, rest = parsed
         else:
-            raise ValidationError(
-                f"Invalid set format: '{part}'.\n"
-                f"Use: reps@weight/rest (e.g. 8@0/180), reps@weight (e.g. 6@+5),\n"
-                f"     or space-separated: reps weight rest (e.g. 8 0 180)."
-            )
+            m = _SET_RE.match(part)
+            if m is None:
+                raise ValidationError(
+                    f"Invalid set format: '{part}'.\n"
+                    f"Use: reps@weight/rest (e.g. 8@0/180), reps@weight (e.g. 6@+5),\n"
+                    f"     or space-separated: reps weight rest (e.g. 8 0 180)."
+                )
+            reps = int(m["reps"])
+            if m["at_weight"] is not None:
+                weight = float(m["at_weight"])
+                rest_s = m["at_rest"]
+            else:
+                weight = float(m["sp_weight"])
+                rest_s = m["sp_rest"]
+            rest = int(rest_s) if rest_s is not None else _DEFAULT_REST_SECONDS
 
         if reps < 0:
             raise ValidationError(f"Reps must be non-negative: {reps}")
@@ -663,7 +696,7 @@ def parse_sets_string(sets_str: str) -> list[tuple[int, float, int]]:
     if not sets:
         raise ValidationError("No valid sets found in sets string")
 
-    return sets
+    return tuple(sets)
 
 
 def session_plan_to_dict(plan: SessionPlan) -> dict:
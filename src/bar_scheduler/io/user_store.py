@@ -5,20 +5,73 @@ Handles reading, writing, and managing the training history file.
 """
 
 import json
+import os
+import re
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 
 from ..core.models import EquipmentState, SessionResult, UserProfile, UserState
+from ._json import dumps_compact, dumps_pretty, loads
 from .serializers import (
     ValidationError,
     dict_to_equipment_state,
     dict_to_session_result,
     dict_to_user_profile,
     equipment_state_to_dict,
-    session_to_json_line,
+    session_result_to_dict,
     user_profile_to_dict,
 )
 
+_by_date = attrgetter("date")
+
+# Parsed history per file, keyed by (st_ino, st_mtime_ns, st_size).  Shared by
+# every UserStore in the process so repeated API calls skip the JSONL parse.
+# Least-recently-used files are evicted beyond _HISTORY_CACHE_SIZE, so a
+# long-lived multi-user process does not keep every history it ever read.
+# The cached SessionResult objects are handed out to callers, which must
+# treat them as read-only.  All access goes through the helpers below, under
+# _history_cache_lock, so threaded servers cannot race a lookup against an
+# eviction.
+_HISTORY_CACHE_SIZE = 256
+_FileKey = tuple[int, int, int]
+_history_cache: OrderedDict[Path, tuple[_FileKey, list[SessionResult]]] = OrderedDict()
+_history_cache_lock = threading.Lock()
+
+
+def _cached_history(path: Path, key: _FileKey) -> list[SessionResult] | None:
+    """Return the cached parse of ``path`` if it was made at ``key``, else None."""
+    with _history_cache_lock:
+        cached = _history_cache.get(path)
+        if cached is None or cached[0] != key:
+            return None
+        _history_cache.move_to_end(path)
+        return cached[1]
+
+
+def _cache_history(path: Path, key: _FileKey, sessions: list[SessionResult]) -> None:
+    """Store the parse of ``path`` at ``key``, evicting the oldest entries."""
+    with _history_cache_lock:
+        _history_cache[path] = (key, sessions)
+        _history_cache.move_to_end(path)
+        while len(_history_cache) > _HISTORY_CACHE_SIZE:
+            _history_cache.popitem(last=False)
+
+
+def _forget_history(path: Path) -> None:
+    """Drop the cached parse of ``path``, if any."""
+    with _history_cache_lock:
+        _history_cache.pop(path, None)
+
+
+# A history line's leading "date" value; the store writes it as the first key.
+_LEADING_DATE_RE = re.compile(rb'\s*\{\s*"date"\s*:\s*"([^"\\]*)"')
+
 
 class UserStore:
     """
@@ -27,15 +80,25 @@ class UserStore:
     One UserStore per user (data_dir). Profile operations need no exercise context.
     Exercise-specific operations (history, plan dates, equipment) accept exercise_id
     as a parameter -- no per-exercise store objects, no dummy IDs.
+
+    Loaded SessionResult objects are shared through a process-wide cache and
+    must not be mutated by callers.
     """
 
     def __init__(self, data_dir: str | Path):
         self.data_dir = Path(data_dir)
         self.profile_path = self.data_dir / "profile.json"
+        self._history_paths: dict[str, Path] = {}
 
     def history_path(self, exercise_id: str) -> Path:
         """Return the JSONL history file path for the given exercise."""
-        return self.data_dir / f"{exercise_id}_history.jsonl"
+        # Memoized: a single API call resolves the same path several times.
+        path = self._history_paths.get(exercise_id)
+        if path is None:
+            path = self._history_paths[exercise_id] = (
+                self.data_dir / f"{exercise_id}_history.jsonl"
+            )
+        return path
 
     def exists(self, exercise_id: str) -> bool:
         """Check if the history file exists for the given exercise."""
@@ -48,9 +111,15 @@ class UserStore:
         Creates parent directories if needed.
         """
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        path = self.history_path(exercise_id)
-        if not path.exists():
-            path.touch()
+        # O_EXCL creates the file only if absent, in one race-free call, and
+        # leaves an existing file's mtime (the plan-cache key) untouched.
+        try:
+            fd = os.open(
+                self.history_path(exercise_id), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644
+            )
+        except FileExistsError:
+            return
+        os.close(fd)
 
     def load_profile(self) -> UserProfile | None:
         """
@@ -59,13 +128,9 @@ class UserStore:
         Returns:
             UserProfile if file exists and is valid, None otherwise
         """
-        if not self.profile_path.exists():
-            return None
-
         try:
-            with open(self.profile_path, "r") as f:
-                data = json.load(f)
-            return dict_to_user_profile(data)
+            data = self._read_profile_data()
+            return dict_to_user_profile(data) if data is not None else None
         except (json.JSONDecodeError, ValidationError, KeyError):
             return None
 
@@ -76,11 +141,10 @@ class UserStore:
         Returns:
             ISO date string or None if not set
         """
-        if not self.profile_path.exists():
-            return None
         try:
-            with open(self.profile_path, "r") as f:
-                data = json.load(f)
+            data = self._read_profile_data()
+            if data is None:
+                return None
             return data.get("plan_start_dates", {}).get(exercise_id)
         except (json.JSONDecodeError, KeyError):
             return None
@@ -96,23 +160,20 @@ class UserStore:
             exercise_id: Exercise identifier
             date: ISO date string (YYYY-MM-DD)
         """
-        if not self.profile_path.exists():
+        data = self._read_profile_data()
+        if data is None:
             return
-        with open(self.profile_path, "r") as f:
-            data = json.load(f)
         if "plan_start_dates" not in data:
             data["plan_start_dates"] = {}
         data["plan_start_dates"][exercise_id] = date
-        with open(self.profile_path, "w") as f:
-            json.dump(data, f, indent=2)
+        self._write_profile_data(data)
 
     def get_plan_weeks(self) -> int | None:
         """Return the last user-specified plan horizon in weeks, or None if never set."""
-        if not self.profile_path.exists():
-            return None
         try:
-            with open(self.profile_path) as f:
-                data = json.load(f)
+            data = self._read_profile_data()
+            if data is None:
+                return None
             v = data.get("plan_weeks")
             return int(v) if v is not None else None
         except (json.JSONDecodeError, ValueError):
@@ -120,13 +181,11 @@ class UserStore:
 
     def set_plan_weeks(self, weeks: int) -> None:
         """Persist the user-chosen plan horizon so subsequent plain 'plan' runs reuse it."""
-        if not self.profile_path.exists():
+        data = self._read_profile_data()
+        if data is None:
             return
-        with open(self.profile_path) as f:
-            data = json.load(f)
         data["plan_weeks"] = weeks
-        with open(self.profile_path, "w") as f:
-            json.dump(data, f, indent=2)
+        self._write_profile_data(data)
 
     def save_profile(self, profile: UserProfile) -> None:
         """
@@ -139,8 +198,34 @@ class UserStore:
 
         data = user_profile_to_dict(profile)
 
-        with open(self.profile_path, "w") as f:
-            json.dump(data, f, indent=2)
+        self._write_profile_data(data)
+
+    def _read_profile_data(self) -> dict | None:
+        """
+        Return the raw profile.json document, or None if the file is missing.
+
+        Opens the file directly instead of checking ``exists()`` first, so
+        each profile read costs one open rather than a stat plus an open.
+        """
+        try:
+            with open(self.profile_path, "rb") as f:
+                return loads(f.read())
+        except FileNotFoundError:
+            return None
+
+    def _write_profile_data(self, data: dict) -> None:
+        """
+        Atomically replace profile.json with ``data``.
+
+        The document is serialized into one buffer, written to a sibling temp
+        file in a single call and moved into place with ``os.replace``, so an
+        interrupted write never leaves a truncated profile behind.
+        """
+        payload = dumps_pretty(data)
+        tmp_path = self.profile_path.with_name(self.profile_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.profile_path)
 
     def update_bodyweight(self, bodyweight_kg: float) -> None:
         """
@@ -149,38 +234,44 @@ class UserStore:
         Args:
             bodyweight_kg: New bodyweight in kg
         """
-        if not self.profile_path.exists():
+        data = self._read_profile_data()
+        if data is None:
             raise FileNotFoundError(
                 f"Profile not found: {self.profile_path}. Run 'init' first."
             )
 
-        with open(self.profile_path, "r") as f:
-            data = json.load(f)
-
+        # log_session calls this after every append; most sessions repeat the
+        # stored bodyweight, so skip the rewrite + rename when nothing changed.
+        if data.get("current_bodyweight_kg") == bodyweight_kg:
+            return
         data["current_bodyweight_kg"] = bodyweight_kg
 
-        with open(self.profile_path, "w") as f:
-            json.dump(data, f, indent=2)
+        self._write_profile_data(data)
 
     def update_language(self, lang: str) -> None:
         """Update the display language in profile.json."""
-        if not self.profile_path.exists():
+        data = self._read_profile_data()
+        if data is None:
             raise FileNotFoundError(
                 f"Profile not found: {self.profile_path}. Run 'init' first."
             )
-        with open(self.profile_path) as f:
-            data = json.load(f)
         if lang == "en":
             data.pop("language", None)
         else:
             data["language"] = lang
-        with open(self.profile_path, "w") as f:
-            json.dump(data, f, indent=2)
+        self._write_profile_data(data)
 
     def load_history(self, exercise_id: str) -> list[SessionResult]:
         """
         Load all sessions from the history file for the given exercise.
 
+        Parsed results are cached per file and reused while the file's
+        inode, mtime and size are unchanged; any other state triggers a full
+        re-parse.  A fresh list is returned on every call, but the
+        SessionResult objects in it are shared with the cache and with other
+        callers: treat them as read-only and derive changed copies with
+        ``dataclasses.replace``.
+
         Returns:
             List of SessionResult, sorted by date
 
@@ -188,36 +279,103 @@ class UserStore:
             FileNotFoundError: If history file doesn't exist
         """
         path = self.history_path(exercise_id)
-        if not path.exists():
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"History file not found: {path}. Run 'init' first."
-            )
+            ) from None
+
+        with f:
+            st = os.fstat(f.fileno())
+            # Any write -- os.replace, append or in-place rewrite -- moves the
+            # mtime and usually the inode or size, so the key goes stale.
+            key = (st.st_ino, st.st_mtime_ns, st.st_size)
+            cached = _cached_history(path, key)
+            if cached is not None:
+                return list(cached)
+
+            # One read of the raw UTF-8 bytes, split in C; no per-line file
+            # I/O.  Read only up to the stat'ed size, so the cache key never
+            # claims fewer bytes than were parsed.
+            data = f.read(st.st_size)
+        sessions = self._parse_history_lines(path, enumerate(data.split(b"\n"), 1))
+        _cache_history(path, key, sessions)
+        return list(sessions)
+
+    def load_history_tail(self, exercise_id: str, limit: int) -> list[SessionResult]:
+        """
+        Load only the last ``limit`` sessions for the given exercise.
+
+        A warm parse cache is sliced directly.  Otherwise the file is read
+        once and the leading ``"date"`` field of every line (the store always
+        writes it first) is checked to be in non-decreasing order; only then
+        are just the last ``limit`` lines JSON-parsed.  A line that is out of
+        order or does not start with its date sends the call through
+        ``load_history`` instead, so the result never depends on the cache
+        state.
 
+        Returns:
+            Up to ``limit`` most recent SessionResult, sorted by date
+
+        Raises:
+            FileNotFoundError: If history file doesn't exist
+        """
+        path = self.history_path(exercise_id)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"History file not found: {path}. Run 'init' first."
+            ) from None
+
+        with f:
+            st = os.fstat(f.fileno())
+            cached = _cached_history(path, (st.st_ino, st.st_mtime_ns, st.st_size))
+            if cached is not None:
+                return cached[-limit:]
+            data = f.read(st.st_size)
+
+        lines = [(n, line) for n, line in enumerate(data.split(b"\n"), 1) if line.strip()]
+        # Proving the whole file is in date order costs a regex per line, far
+        # less than JSON-parsing every line.
+        prev = b""
+        for _, line in lines:
+            m = _LEADING_DATE_RE.match(line)
+            if m is None or m[1] < prev:
+                return self.load_history(exercise_id)[-limit:]
+            prev = m[1]
+        return self._parse_history_lines(path, lines[-limit:])
+
+    @staticmethod
+    def _parse_history_lines(
+        path: Path, lines: Iterable[tuple[int, bytes]]
+    ) -> list[SessionResult]:
+        """Parse numbered JSONL lines into SessionResults sorted by date."""
         sessions: list[SessionResult] = []
 
-        with open(path, "r") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
+        for line_num, line in lines:
+            line = line.strip()
+            if not line:
+                continue
 
-                try:
-                    data = json.loads(line)
+            try:
+                data = loads(line)
 
-                    # Skip profile records (legacy support)
-                    if data.get("type") == "profile":
-                        continue
+                # Skip profile records (legacy support)
+                if data.get("type") == "profile":
+                    continue
 
-                    session = dict_to_session_result(data)
-                    sessions.append(session)
+                session = dict_to_session_result(data)
+                sessions.append(session)
 
-                except (json.JSONDecodeError, ValidationError) as e:
-                    raise ValidationError(
-                        f"Error parsing line {line_num} in {path}: {e}"
-                    ) from e
+            except (json.JSONDecodeError, ValidationError) as e:
+                raise ValidationError(
+                    f"Error parsing line {line_num} in {path}: {e}"
+                ) from e
 
         # Sort by date
-        sessions.sort(key=lambda s: s.date)
+        sessions.sort(key=_by_date)
 
         return sessions
 
@@ -252,51 +410,126 @@ class UserStore:
         Maintains chronological order by inserting at the correct position.
         Uses session.exercise_id to determine the history file.
 
+        A session dated after every existing one (the usual case) is
+        appended as a single line; only back-dated sessions or same-date
+        replacements rewrite the file.
+
         Args:
             session: Session to append
         """
-        path = self.history_path(session.exercise_id)
-        if not path.exists():
-            raise FileNotFoundError(
-                f"History file not found: {path}. Run 'init' first."
-            )
+        self.append_sessions([session])
 
-        # Load existing sessions
-        sessions = self.load_history(session.exercise_id)
+    def append_sessions(self, sessions: Iterable[SessionResult]) -> None:
+        """
+        Append several sessions, issuing one write per history file.
+
+        Each session is placed exactly as ``append_session`` would place it,
+        in the order given.  When every session lands after the existing
+        history, their lines are appended together in a single write;
+        otherwise the file is rewritten once for the whole batch.
+
+        Args:
+            sessions: Sessions to append (may span several exercises)
+
+        Raises:
+            FileNotFoundError: If a history file is not initialized
+        """
+        by_exercise: dict[str, list[SessionResult]] = {}
+        for session in sessions:
+            by_exercise.setdefault(session.exercise_id, []).append(session)
+
+        for exercise_id, new_sessions in by_exercise.items():
+            # Load existing sessions (raises FileNotFoundError if not initialized)
+            history = self.load_history(exercise_id)
+            lines: list[bytes] = []
+            rewrite = False
+
+            for session in new_sessions:
+                data = session_result_to_dict(session)
+                # Keep the deserialized form, which is what the parse cache holds.
+                session = dict_to_session_result(data)
+
+                if not history or session.date > history[-1].date:
+                    history.append(session)
+                    lines.append(dumps_compact(data) + b"\n")
+                    continue
 
-        # Insert new session in chronological order
-        session_date = datetime.strptime(session.date, "%Y-%m-%d")
-        insert_idx = len(sessions)
+                # History is sorted by ISO date string: bisect to the block of
+                # sessions on the same date instead of scanning from the start.
+                rewrite = True
+                lo = bisect_left(history, session.date, key=_by_date)
+                hi = bisect_right(history, session.date, lo=lo, key=_by_date)
 
-        for i, existing in enumerate(sessions):
-            existing_date = datetime.strptime(existing.date, "%Y-%m-%d")
-            if session_date < existing_date:
-                insert_idx = i
-                break
-            elif session_date == existing_date:
                 # Same date: replace existing session of same type, or insert after
-                if existing.session_type == session.session_type:
-                    sessions[i] = session
-                    insert_idx = -1  # Signal that we replaced
-                    break
+                for i in range(lo, hi):
+                    if history[i].session_type == session.session_type:
+                        history[i] = session
+                        break
+                else:
+                    history.insert(hi, session)
 
-        if insert_idx >= 0:
-            sessions.insert(insert_idx, session)
+            if rewrite:
+                self._write_sessions(exercise_id, history)
+            else:
+                self._append_lines(exercise_id, b"".join(lines), history)
 
-        # Rewrite file
-        self._write_sessions(session.exercise_id, sessions)
+    def _append_lines(
+        self, exercise_id: str, payload: bytes, sessions: list[SessionResult]
+    ) -> None:
+        """
+        Append encoded session lines to the end of a history file.
+
+        ``sessions`` is the full parsed history including the appended
+        sessions; the parse cache is updated with it so the next load skips
+        the re-parse.
+        """
+        path = self.history_path(exercise_id)
+        # Unbuffered O_APPEND descriptor: the lines go out in one write()
+        # at the end of the file, never interleaved with another appender.
+        fd = os.open(path, os.O_RDWR | os.O_APPEND | getattr(os, "O_BINARY", 0))
+        try:
+            end = os.lseek(fd, 0, os.SEEK_END)
+            if end:
+                # Never glue onto a hand-edited last line without a newline.
+                os.lseek(fd, end - 1, os.SEEK_SET)
+                if os.read(fd, 1) != b"\n":
+                    payload = b"\n" + payload
+            os.write(fd, payload)
+            st = os.fstat(fd)
+        finally:
+            os.close(fd)
+        _cache_history(path, (st.st_ino, st.st_mtime_ns, st.st_size), sessions)
 
     def _write_sessions(self, exercise_id: str, sessions: list[SessionResult]) -> None:
         """
         Write all sessions to the history file for the given exercise.
 
+        The file is rebuilt in a sibling temp file and moved into place with
+        ``os.replace``, like ``_write_profile_data``, so a failed rewrite
+        never truncates the existing history.  The whole document is encoded
+        into one buffer and written with a single call.
+
+        ``sessions`` becomes the cached parse of the new file, so it must
+        hold deserialized sessions (as returned by ``load_history``).
+
         Args:
             exercise_id: Exercise identifier
             sessions: Sessions to write
         """
-        with open(self.history_path(exercise_id), "w") as f:
-            for session in sessions:
-                f.write(session_to_json_line(session) + "\n")
+        path = self.history_path(exercise_id)
+        tmp_path = path.with_name(path.name + ".tmp")
+        payload = b"".join(
+            [dumps_compact(session_result_to_dict(s)) + b"\n" for s in sessions]
+        )
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            # Flush first: the stat must see the written size and mtime.
+            f.flush()
+            st = os.fstat(f.fileno())
+        os.replace(tmp_path, path)
+        # os.replace keeps the temp file's inode and mtime, so this key
+        # matches what load_history will stat next.
+        _cache_history(path, (st.st_ino, st.st_mtime_ns, st.st_size), sessions)
 
     def get_latest_session(self, exercise_id: str) -> SessionResult | None:
         """
@@ -322,10 +555,13 @@ class UserStore:
         Returns:
             List of sessions after the date
         """
+        # Rejects malformed dates and zero-pads accepted ones ("2026-1-5"),
+        # so the string comparison below matches the stored ISO dates.
+        target = datetime.strptime(date, "%Y-%m-%d").date().isoformat()
         sessions = self.load_history(exercise_id)
-        target = datetime.strptime(date, "%Y-%m-%d")
 
-        return [s for s in sessions if datetime.strptime(s.date, "%Y-%m-%d") > target]
+        # Sorted by ISO date string, so everything after the target is a suffix.
+        return sessions[bisect_right(sessions, target, key=_by_date) :]
 
     def delete_session_at(self, exercise_id: str, index: int) -> None:
         """
@@ -348,32 +584,40 @@ class UserStore:
 
     def _input_files_mtime(self, exercise_id: str) -> float:
         """Max mtime of profile.json and history JSONL (the two plan inputs)."""
-        mtimes = [
-            p.stat().st_mtime
-            for p in (self.profile_path, self.history_path(exercise_id))
-            if p.exists()
-        ]
-        return max(mtimes) if mtimes else 0.0
-
-    def load_plan_result_cache(self, exercise_id: str) -> dict | None:
-        """Load the plan result cache, or None if absent/corrupt."""
+        mtime = 0.0
+        for p in (self.profile_path, self.history_path(exercise_id)):
+            try:
+                mtime = max(mtime, os.stat(p).st_mtime)
+            except FileNotFoundError:
+                continue
+        return mtime
+
+    def load_plan_result_cache(
+        self, exercise_id: str, min_mtime: float = 0.0
+    ) -> dict | None:
+        """
+        Load the plan result cache, or None if absent/corrupt.
+
+        If the cache file was last written before ``min_mtime`` it cannot be
+        fresh (``generated_at`` is taken just before the write), so None is
+        returned without reading or parsing it.
+        """
         path = self.data_dir / f"{exercise_id}_plan_cache.json"
-        if not path.exists():
-            return None
         try:
-            with open(path) as f:
-                data = json.load(f)
+            if os.stat(path).st_mtime < min_mtime:
+                return None
+            with open(path, "rb") as f:
+                data = loads(f.read())
             return data if isinstance(data, dict) else None
         except (json.JSONDecodeError, OSError):
             return None
 
     def save_plan_result_cache(self, exercise_id: str, plans: list[dict]) -> None:
         """Persist the generated plan list with a generation timestamp."""
-        import time
-
         path = self.data_dir / f"{exercise_id}_plan_cache.json"
-        with open(path, "w") as f:
-            json.dump({"generated_at": time.time(), "plans": plans}, f)
+        payload = dumps_compact({"generated_at": time.time(), "plans": plans})
+        with open(path, "wb") as f:
+            f.write(payload)
 
     # ------------------------------------------------------------------
     # Equipment profile persistence
@@ -386,16 +630,25 @@ class UserStore:
         Return the current EquipmentState for the given exercise,
         or None if none has been configured yet.
         """
-        if not self.profile_path.exists():
+        try:
+            data = self._read_profile_data()
+        except json.JSONDecodeError:
+            return None
+        return self._equipment_from_profile_data(data, exercise_id)
+
+    @staticmethod
+    def _equipment_from_profile_data(
+        data: dict | None, exercise_id: str
+    ) -> EquipmentState | None:
+        """Extract an exercise's EquipmentState from a raw profile document."""
+        if data is None:
             return None
         try:
-            with open(self.profile_path) as f:
-                data = json.load(f)
             raw = data.get("equipment", {}).get(exercise_id)
             if raw is None:
                 return None
             return dict_to_equipment_state(raw)
-        except (json.JSONDecodeError, KeyError, TypeError):
+        except (KeyError, TypeError):
             return None
 
     def update_equipment(self, new_state: EquipmentState) -> None:
@@ -405,15 +658,13 @@ class UserStore:
         Args:
             new_state: EquipmentState to store
         """
-        if not self.profile_path.exists():
+        data = self._read_profile_data()
+        if data is None:
             return
-        with open(self.profile_path) as f:
-            data = json.load(f)
         if "equipment" not in data:
             data["equipment"] = {}
         data["equipment"][new_state.exercise_id] = equipment_state_to_dict(new_state)
-        with open(self.profile_path, "w") as f:
-            json.dump(data, f, indent=2)
+        self._write_profile_data(data)
 
     def clear_history(self, exercise_id: str) -> None:
         """
@@ -422,3 +673,14 @@ class UserStore:
         path = self.history_path(exercise_id)
         if path.exists():
             path.write_text("")
+        _forget_history(path)
+
+    def delete_history(self, exercise_id: str) -> None:
+        """
+        Delete the history file for the given exercise, if present.
+
+        Also drops its cached parse.
+        """
+        path = self.history_path(exercise_id)
+        path.unlink(missing_ok=True)
+        _forget_history(path)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 
@@ -12,9 +13,12 @@ from bar_scheduler.api import (
     HistoryNotFoundError,
     ProfileAlreadyExistsError,
     ProfileNotFoundError,
+    SessionNotFoundError,
+    ValidationError,
     compute_equipment_adjustment,
     compute_leff,
     delete_exercise_history,
+    delete_session,
     disable_exercise,
     enable_exercise,
     get_assistance_kg,
@@ -593,6 +597,49 @@ class TestDeleteExerciseHistory:
         delete_exercise_history(tmp_path, "pull_up")
         assert not jsonl.exists()
 
+    def test_drops_cached_parse(self, tmp_path):
+        from bar_scheduler.io import user_store
+
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session())
+        get_history(tmp_path, "pull_up")
+        jsonl = tmp_path / "pull_up_history.jsonl"
+        assert jsonl in user_store._history_cache
+        delete_exercise_history(tmp_path, "pull_up")
+        assert jsonl not in user_store._history_cache
+
+
+class TestHistoryCacheBound:
+    def test_least_recently_used_history_is_evicted(self, tmp_path, monkeypatch):
+        from bar_scheduler.io import user_store
+
+        monkeypatch.setattr(user_store, "_HISTORY_CACHE_SIZE", 2)
+        monkeypatch.setattr(user_store, "_history_cache", user_store.OrderedDict())
+        dirs = [tmp_path / name for name in ("a", "b", "c")]
+        for d in dirs:
+            _init(d)
+            log_session(d, "pull_up", _test_session())
+        get_history(dirs[0], "pull_up")  # touch a: b is now the oldest
+        get_history(dirs[2], "pull_up")
+        cached = set(user_store._history_cache)
+        assert cached == {dirs[0] / "pull_up_history.jsonl", dirs[2] / "pull_up_history.jsonl"}
+
+    def test_concurrent_loads_survive_eviction(self, tmp_path, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from bar_scheduler.io import user_store
+
+        monkeypatch.setattr(user_store, "_HISTORY_CACHE_SIZE", 1)
+        monkeypatch.setattr(user_store, "_history_cache", user_store.OrderedDict())
+        dirs = [tmp_path / name for name in ("a", "b", "c", "d")]
+        for d in dirs:
+            _init(d)
+            log_session(d, "pull_up", _test_session())
+        stores = [user_store.UserStore(d) for d in dirs] * 100
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda s: s.load_history("pull_up"), stores))
+        assert all(len(r) == 1 for r in results)
+
 
 # ---------------------------------------------------------------------------
 # TestGetCurrentEquipment
@@ -1154,6 +1201,11 @@ class TestLogSessionTyped:
         assert result["completed_sets"][1]["rir_reported"] == 1
         assert result["session_metrics"]["volume_session"] is not None
 
+    def test_unpadded_date_raises_validation_error(self, tmp_path):
+        _init(tmp_path)
+        with pytest.raises(ValidationError, match="Invalid date format"):
+            log_session(tmp_path, "pull_up", _test_session("2026-1-5"))
+
     def test_log_session_updates_profile_bodyweight(self, tmp_path):
         _init(tmp_path, bodyweight_kg=81.7)
         si = SessionInput(
@@ -1165,6 +1217,15 @@ class TestLogSessionTyped:
         log_session(tmp_path, "pull_up", si)
         assert get_profile(tmp_path)["current_bodyweight_kg"] == 83.0
 
+    def test_bodyweight_checked_before_date(self):
+        with pytest.raises(ValueError, match="bodyweight_kg must be > 0"):
+            SessionInput(
+                date="not-a-date",
+                session_type="S",
+                bodyweight_kg=0,
+                sets=[SetInput(reps=5, rest_seconds=180)],
+            )
+
 
 class TestPlanCacheCompat:
     def test_legacy_list_cache_is_ignored(self, tmp_path):
@@ -1177,3 +1238,364 @@ class TestPlanCacheCompat:
         path = tmp_path / "pull_up_plan_cache.json"
         path.write_text(json.dumps([{"date": "2025-01-01"}]))
         assert store.load_plan_result_cache("pull_up") is None
+
+
+class TestProfileAtomicWrite:
+    def test_profile_write_leaves_no_temp_file(self, tmp_path):
+        _init(tmp_path)
+        update_bodyweight(tmp_path, 82.5)
+        assert not (tmp_path / "profile.json.tmp").exists()
+        data = json.loads((tmp_path / "profile.json").read_text())
+        assert data["current_bodyweight_kg"] == 82.5
+
+    def test_api_profile_edits_are_atomic(self, tmp_path):
+        _init(tmp_path)
+        set_exercise_days(tmp_path, "pull_up", 4)
+        update_profile(tmp_path, height_cm=181)
+        assert not (tmp_path / "profile.json.tmp").exists()
+        data = json.loads((tmp_path / "profile.json").read_text())
+        assert data["exercise_days"]["pull_up"] == 4
+        assert data["height_cm"] == 181
+
+    def test_history_rewrite_leaves_no_temp_file(self, tmp_path):
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session())
+        assert not (tmp_path / "pull_up_history.jsonl.tmp").exists()
+        assert len(get_history(tmp_path, "pull_up")) == 1
+
+
+class TestHistoryEncoding:
+    def test_non_ascii_notes_round_trip(self, tmp_path):
+        _init(tmp_path)
+        si = SessionInput(
+            date=_today(),
+            session_type="S",
+            bodyweight_kg=80.0,
+            sets=[SetInput(reps=5, rest_seconds=180)],
+            notes="тяжело — 💪",
+        )
+        log_session(tmp_path, "pull_up", si)
+        assert get_history(tmp_path, "pull_up")[0]["notes"] == "тяжело — 💪"
+
+
+class TestDeleteSession:
+    def test_deletes_by_one_based_index(self, tmp_path):
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session("2026-01-01"))
+        log_session(tmp_path, "pull_up", _test_session("2026-01-05"))
+        delete_session(tmp_path, "pull_up", 1)
+        assert [s["date"] for s in get_history(tmp_path, "pull_up")] == ["2026-01-05"]
+
+    @pytest.mark.parametrize("index", [0, 2])
+    def test_out_of_range_raises(self, tmp_path, index):
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session())
+        with pytest.raises(SessionNotFoundError, match="history has 1 sessions"):
+            delete_session(tmp_path, "pull_up", index)
+
+
+class TestLogSessionBodyweightWrite:
+    def test_unchanged_bodyweight_skips_profile_rewrite(self, tmp_path):
+        _init(tmp_path, bodyweight_kg=80.0)
+        profile_path = tmp_path / "profile.json"
+        before = profile_path.stat().st_mtime_ns
+        log_session(tmp_path, "pull_up", _test_session())
+        assert profile_path.stat().st_mtime_ns == before
+
+    def test_changed_bodyweight_is_persisted(self, tmp_path):
+        _init(tmp_path, bodyweight_kg=80.0)
+        si = _test_session()
+        si.bodyweight_kg = 81.5
+        log_session(tmp_path, "pull_up", si)
+        assert get_profile(tmp_path)["current_bodyweight_kg"] == 81.5
+
+
+class TestGetHistoryLimit:
+    def test_limit_returns_most_recent_sessions(self, tmp_path):
+        _init(tmp_path)
+        for day in ("2026-01-05", "2026-01-01", "2026-01-03"):
+            log_session(tmp_path, "pull_up", _test_session(day))
+        recent = get_history(tmp_path, "pull_up", limit=2)
+        assert [s["date"] for s in recent] == ["2026-01-03", "2026-01-05"]
+
+    def test_limit_larger_than_history(self, tmp_path):
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session())
+        assert len(get_history(tmp_path, "pull_up", limit=50)) == 1
+
+    def test_non_positive_limit_raises(self, tmp_path):
+        _init(tmp_path)
+        with pytest.raises(ValueError):
+            get_history(tmp_path, "pull_up", limit=0)
+
+    def test_cold_tail_of_longer_history(self, tmp_path):
+        from bar_scheduler.io import user_store
+
+        _init(tmp_path)
+        days = [f"2026-01-{d:02d}" for d in range(1, 11)]
+        for day in days:
+            log_session(tmp_path, "pull_up", _test_session(day))
+        user_store._history_cache.clear()
+        recent = get_history(tmp_path, "pull_up", limit=3)
+        assert [s["date"] for s in recent] == days[-3:]
+
+    def test_cold_tail_of_unsorted_file_matches_full_history(self, tmp_path):
+        from bar_scheduler.io import user_store
+
+        _init(tmp_path)
+        for day in ("2026-01-01", "2026-01-05"):
+            log_session(tmp_path, "pull_up", _test_session(day))
+        path = tmp_path / "pull_up_history.jsonl"
+        line = json.loads(path.read_text().splitlines()[0])
+        line["date"] = "2026-01-03"
+        with open(path, "a") as f:  # back-dated line appended outside the store
+            f.write(json.dumps(line) + "\n")
+        user_store._history_cache.clear()
+        cold = get_history(tmp_path, "pull_up", limit=1)
+        assert [s["date"] for s in cold] == ["2026-01-05"]
+        assert cold == get_history(tmp_path, "pull_up")[-1:]
+        assert get_history(tmp_path, "pull_up", limit=1) == cold
+
+    def test_cold_tail_with_newest_line_at_top(self, tmp_path):
+        from datetime import date, timedelta
+
+        from bar_scheduler.io import user_store
+
+        _init(tmp_path)
+        # Enough lines that the file is well over one 8 KiB read.
+        days = [(date(2026, 1, 1) + timedelta(days=i)).isoformat() for i in range(80)]
+        for day in days:
+            log_session(tmp_path, "pull_up", _test_session(day))
+        path = tmp_path / "pull_up_history.jsonl"
+        lines = path.read_bytes().splitlines(keepends=True)
+        path.write_bytes(b"".join([lines[-1]] + lines[:-1]))  # far above the tail
+        user_store._history_cache.clear()
+        cold = get_history(tmp_path, "pull_up", limit=2)
+        assert [s["date"] for s in cold] == days[-2:]
+        assert cold == get_history(tmp_path, "pull_up")[-2:]
+
+    def test_tail_parse_error_reports_file_line(self, tmp_path):
+        _init(tmp_path)
+        for d in range(1, 6):
+            log_session(tmp_path, "pull_up", _test_session(f"2026-01-{d:02d}"))
+        path = tmp_path / "pull_up_history.jsonl"
+        path.write_bytes(path.read_bytes() + b"{not json\n")
+        with pytest.raises(ValidationError, match="line 6"):
+            get_history(tmp_path, "pull_up", limit=2)
+
+
+class TestHistoryParseCache:
+    def test_external_edit_invalidates_cache(self, tmp_path):
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session("2026-01-01"))
+        assert len(get_history(tmp_path, "pull_up")) == 1
+        path = tmp_path / "pull_up_history.jsonl"
+        line = path.read_bytes().splitlines()[0]
+        path.write_bytes(line + b"\n" + line.replace(b"2026-01-01", b"2026-01-02") + b"\n")
+        assert [s["date"] for s in get_history(tmp_path, "pull_up")] == [
+            "2026-01-01",
+            "2026-01-02",
+        ]
+
+    def test_cached_list_is_not_shared(self, tmp_path):
+        from bar_scheduler.io.user_store import UserStore
+
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session())
+        store = UserStore(tmp_path)
+        store.load_history("pull_up").clear()
+        assert len(store.load_history("pull_up")) == 1
+
+    def test_mutating_returned_metrics_does_not_leak(self, tmp_path):
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session())
+        get_history(tmp_path, "pull_up")[0]["session_metrics"]["volume_session"] = -1
+        assert get_history(tmp_path, "pull_up")[0]["session_metrics"]["volume_session"] != -1
+
+
+class TestAppendOnlyLog:
+    def test_newest_session_is_appended_without_rewrite(self, tmp_path):
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session("2026-01-01"))
+        path = tmp_path / "pull_up_history.jsonl"
+        ino = path.stat().st_ino
+        log_session(tmp_path, "pull_up", _test_session("2026-01-08"))
+        assert path.stat().st_ino == ino  # appended in place, not replaced
+        assert len(path.read_bytes().splitlines()) == 2
+
+    def test_backdated_session_keeps_file_sorted(self, tmp_path):
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session("2026-01-08"))
+        log_session(tmp_path, "pull_up", _test_session("2026-01-01"))
+        lines = (tmp_path / "pull_up_history.jsonl").read_text().splitlines()
+        assert [json.loads(l)["date"] for l in lines] == ["2026-01-01", "2026-01-08"]
+
+    def test_backdated_same_date_replaces_same_type(self, tmp_path):
+        _init(tmp_path)
+        for day in ("2026-01-01", "2026-01-03", "2026-01-08"):
+            log_session(tmp_path, "pull_up", _test_session(day))
+        redo = _test_session("2026-01-03")
+        redo.sets = [SetInput(reps=14, rest_seconds=180)]
+        log_session(tmp_path, "pull_up", redo)
+        history = get_history(tmp_path, "pull_up")
+        assert [s["date"] for s in history] == ["2026-01-01", "2026-01-03", "2026-01-08"]
+        assert history[1]["completed_sets"][0]["actual_reps"] == 14
+
+    def test_rewrite_seeds_a_hit_for_the_next_load(self, tmp_path, monkeypatch):
+        from bar_scheduler.io.user_store import UserStore
+
+        _init(tmp_path)
+        for day in ("2026-01-01", "2026-01-08", "2026-01-03"):  # last one rewrites
+            log_session(tmp_path, "pull_up", _test_session(day))
+
+        def no_parse(*args, **kwargs):
+            raise AssertionError("history was re-parsed")
+
+        monkeypatch.setattr(UserStore, "_parse_history_lines", staticmethod(no_parse))
+        history = UserStore(tmp_path).load_history("pull_up")
+        assert [s.date for s in history] == ["2026-01-01", "2026-01-03", "2026-01-08"]
+
+    def test_append_after_line_without_newline(self, tmp_path):
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session("2026-01-01"))
+        path = tmp_path / "pull_up_history.jsonl"
+        path.write_bytes(path.read_bytes().rstrip(b"\n"))
+        log_session(tmp_path, "pull_up", _test_session("2026-01-08"))
+        assert len(get_history(tmp_path, "pull_up")) == 2
+
+    def test_sessions_after_unpadded_date(self, tmp_path):
+        from bar_scheduler.io.user_store import UserStore
+
+        _init(tmp_path)
+        for day in ("2026-01-03", "2026-01-10", "2026-02-01"):
+            log_session(tmp_path, "pull_up", _test_session(day))
+        after = UserStore(tmp_path).get_sessions_after("pull_up", "2026-1-5")
+        assert [s.date for s in after] == ["2026-01-10", "2026-02-01"]
+
+    def test_append_sessions_batches_in_place(self, tmp_path):
+        from bar_scheduler.io.user_store import UserStore
+
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session("2026-01-01"))
+        store = UserStore(tmp_path)
+        first = store.load_history("pull_up")[0]
+        path = tmp_path / "pull_up_history.jsonl"
+        ino = path.stat().st_ino
+        store.append_sessions(
+            [replace(first, date="2026-01-05"), replace(first, date="2026-01-08")]
+        )
+        assert path.stat().st_ino == ino
+        assert [s["date"] for s in get_history(tmp_path, "pull_up")] == [
+            "2026-01-01", "2026-01-05", "2026-01-08"
+        ]
+
+    def test_append_sessions_with_backdated_entry(self, tmp_path):
+        from bar_scheduler.io.user_store import UserStore
+
+        _init(tmp_path)
+        log_session(tmp_path, "pull_up", _test_session("2026-01-05"))
+        store = UserStore(tmp_path)
+        first = store.load_history("pull_up")[0]
+        store.append_sessions(
+            [replace(first, date="2026-01-08"), replace(first, date="2026-01-01")]
+        )
+        lines = (tmp_path / "pull_up_history.jsonl").read_text().splitlines()
+        assert [json.loads(l)["date"] for l in lines] == [
+            "2026-01-01", "2026-01-05", "2026-01-08"
+        ]
+
+    @pytest.mark.parametrize("day", ["2026-01-08", "2026-01-03"])
+    def test_external_append_is_picked_up(self, tmp_path, day):
+        _init(tmp_path)
+        for d in ("2026-01-01", "2026-01-05"):
+            log_session(tmp_path, "pull_up", _test_session(d))
+        get_history(tmp_path, "pull_up")  # warm the parse cache
+        path = tmp_path / "pull_up_history.jsonl"
+        line = json.loads(path.read_text().splitlines()[0])
+        line["date"] = day
+        with open(path, "a") as f:
+            f.write(json.dumps(line) + "\n")
+        dates = [s["date"] for s in get_history(tmp_path, "pull_up")]
+        assert dates == sorted(["2026-01-01", "2026-01-05", day])
+
+    def test_in_place_rewrite_that_grows_is_reparsed(self, tmp_path):
+        _init(tmp_path)
+        for d in ("2026-01-01", "2026-01-05"):
+            log_session(tmp_path, "pull_up", _test_session(d))
+        get_history(tmp_path, "pull_up")
+        path = tmp_path / "pull_up_history.jsonl"
+        lines = path.read_text().splitlines()
+        first = json.loads(lines[0])
+        first["completed_sets"][0]["actual_reps"] = 17  # same width as 12
+        lines[0] = json.dumps(first, separators=(",", ":"))
+        extra = dict(first, date="2026-01-08")
+        with open(path, "w") as f:  # same inode, larger file
+            f.write("\n".join(lines + [json.dumps(extra)]) + "\n")
+        history = get_history(tmp_path, "pull_up")
+        assert [s["date"] for s in history] == ["2026-01-01", "2026-01-05", "2026-01-08"]
+        assert history[0]["completed_sets"][0]["actual_reps"] == 17
+
+    def test_external_append_parse_error_reports_file_line(self, tmp_path):
+        _init(tmp_path)
+        for d in ("2026-01-01", "2026-01-05"):
+            log_session(tmp_path, "pull_up", _test_session(d))
+        get_history(tmp_path, "pull_up")
+        with open(tmp_path / "pull_up_history.jsonl", "a") as f:
+            f.write("{not json\n")
+        with pytest.raises(ValidationError, match="line 3"):
+            get_history(tmp_path, "pull_up")
+
+
+class TestLazyApiImports:
+    @pytest.mark.parametrize(
+        "module", ["bar_scheduler.core.planner", "bar_scheduler.core.exercises.registry"]
+    )
+    def test_profile_import_skips_heavy_modules(self, module):
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from bar_scheduler.api import get_profile\n"
+            f"print({module!r} in sys.modules)\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_session_functions_skip_planner(self):
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from bar_scheduler.api import get_history, log_session\n"
+            "print('bar_scheduler.core.planner' in sys.modules)\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_every_exported_name_resolves(self):
+        import bar_scheduler.api as api
+
+        for name in api.__all__:
+            assert getattr(api, name) is not None
+
+    def test_all_matches_lazy_exports(self):
+        import bar_scheduler.api as api
+
+        assert len(api.__all__) == len(set(api.__all__))
+        assert set(api.__all__) == set(api._EXPORTS)
+
+    def test_unknown_name_raises_attribute_error(self):
+        import bar_scheduler.api as api
+
+        with pytest.raises(AttributeError):
+            api.no_such_function